@@ -8,36 +8,67 @@ import maya.mel as mel
 import os
 import sys
 import logging
+from importlib import import_module
 
-logger = logging.getLogger(__name__)
+_logger = None
+_SHELF_CMD = "import jmLightToolkit;jmLightToolkit.main();"
+_ICON_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), 'src', 'resources', 'icons', 'logo_jm.png'))
+_exists_cache = {}
+_shelf_top = None
+
+
+def _getLogger():
+    """ Get module logger, created on first use only. """
+    global _logger
+    if _logger is None:
+        _logger = logging.getLogger(__name__)
+
+    return _logger
+
+
+def _cachedExists(path):
+    """ Check once if path exists then cache the result. """
+    exists = _exists_cache.get(path)
+    if exists is None:
+        exists = os.access(path, os.F_OK)
+        _exists_cache[path] = exists
+
+    return exists
+
+
+def _getShelfTopLevel():
+    """ Get Maya shelf tab layout, queried from MEL only once per session. """
+    global _shelf_top
+    if _shelf_top is None or not cmds.tabLayout(_shelf_top, exists=True):
+        _shelf_top = mel.eval('global string $gShelfTopLevel; $tmp = $gShelfTopLevel')
+
+    return _shelf_top
 
 
 def onMayaDroppedPythonFile(*args, **kwargs):
     """ Dragging and dropping one into the scene automatically executes it. """
     # Get icon
-    icon_path = os.path.join(os.path.dirname(__file__), 'src', 'resources', 'icons', 'logo_jm.png')
-    icon_path = os.path.normpath(icon_path)
+    icon_path = _ICON_PATH
 
     # Check if icon exist
-    if not os.path.exists(icon_path):
-        logger.error("Cannot find %s" % icon_path)
+    if not _cachedExists(icon_path):
+        _getLogger().error("Cannot find %s", icon_path)
         return None
 
     # Check PYTHONPATH
-    try:
-        import jmLightToolkit
-    except ImportError:
-        logger.error("'jmLightToolkit' not found in PYTHON_PATH")
-        return None
+    if 'jmLightToolkit' not in sys.modules:
+        try:
+            import_module('jmLightToolkit')
+        except ImportError:
+            _getLogger().error("'jmLightToolkit' not found in PYTHON_PATH")
+            return None
 
     # Create Shelf
-    command  = "import jmLightToolkit;"
-    command += "jmLightToolkit.main();"
-    shelf = mel.eval('$gShelfTopLevel=$gShelfTopLevel')
+    shelf = _getShelfTopLevel()
     parent = cmds.tabLayout(shelf, query=True, selectTab=True)
 
     cmds.shelfButton(
-        command=command,
+        command=_SHELF_CMD,
         annotation='jmLightToolkit',
         sourceType='Python',
         image=icon_path,
@@ -10,13 +10,14 @@ from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
 from PySide2 import QtWidgets, QtGui, QtCore
 from PySide2.QtWidgets import QWidget
 from maya import OpenMayaUI as omui
-from shiboken2 import getCppPointer
+import maya.api.OpenMaya as om2
+import maya.cmds as cmds
 from functools import partial
+from contextlib import contextmanager
 import pymel.core as pm
 import logging
 import os
 import sys
-import sys
 import math
 import re
 
@@ -30,12 +31,54 @@ _lightToolkitWindow = None
 _lightFiltersWindow = None
 _lookThroughWindow = None
 _logger = logging.getLogger(__name__)
+_icons_cache = {}
+_LINKABLE_TYPES = frozenset(["mesh", "aiStandIn", "pgYetiMaya"])
+_DISPLAY_SHAPE_ATTRS = (
+    "castsShadows",
+    "receiveShadows",
+    "motionBlur",
+    "primaryVisibility",
+    "smoothShading",
+    "visibleInReflections",
+    "visibleInRefractions",
+    "doubleSided",
+    "aiOpaque",
+    "aiVisibleInDiffuseReflection",
+    "aiVisibleInSpecularReflection",
+    "aiVisibleInDiffuseTransmission",
+    "aiVisibleInSpecularTransmission",
+    "aiSelfShadows",
+)
+_OUTLINER_COLORS = {
+    "red" : (1.000, 0.500, 0.500),
+    "orange" : (0.900, 0.700, 0.400),
+    "yellow" : (1.000, 1.000, 0.500),
+    "green" : (0.600, 1.000, 0.400),
+    "turquoise" : (0.300, 1.000, 0.700),
+    "cyan" : (0.500, 1.000, 1.000),
+    "blue" : (0.300, 0.700, 1.000),
+    "purple" : (0.600, 0.400, 1.000),
+    "magenta" : (1.000, 0.500, 1.000),
+}
+# Optimizer slider maximum per attribute, its last step lists every value above
+_OPTIMIZER_OVERFLOW = {
+    "aiSamples" : 11,
+    "aiVolumeSamples" : 11,
+    "aiRadius" : 101,
+    "aiExposure" : 21,
+    "intensity" : 21,
+}
+_SPLIT_RE = re.compile(r"\s*,\s*")
+_AIFILTER_IDX_RE = re.compile(r"\[(\d+)\]$")
+_LIGHT_NAME_RE = re.compile(
+    r"^(?P<lightname>[A-Za-z0-9]+)(?P<under>[_])(?P<utility>[a-zA-Z]*)(?P<left>[A-Za-z0-9_]+)$")
 
 CUSTOM_INDEX = 32
 TOOLKIT_NAME = "jmLightToolkit"
 FILTERS_NAME = "jmUnusedLightFilters"
 THROUGH_NAME = "jmLookThroughWindow"
 PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+ICONS_DIR = os.path.join(PROJECT_DIR, "resources", "icons")
 
 if PROJECT_DIR not in sys.path:
     sys.path.insert(0, PROJECT_DIR)
@@ -43,11 +86,111 @@ if PROJECT_DIR not in sys.path:
 from jmLightToolkitUI import Ui_widget_root
 from jmLightToolkitUI import Ui_widget_lightOptimizerItem
 from jmLightToolkitUI import Ui_widget_unusedFiltersList
-from jmLightToolkitUI import Ui_widget_unusedFiltersItem
+
+
+@contextmanager
+def undoScope(undo_chunk=True, restore_selection=False, suspend_refresh=False):
+    """ Either open an undo chunk or recover selection, or both, around a block.
+
+        Args:
+            undo_chunk (bool): Wrap block in a single undo chunk if True.
+            restore_selection (bool): Recover selection at exit if True.
+            suspend_refresh (bool): Suspend viewport refresh during block if True.
+    """
+    selected = cmds.ls(sl=True, long=True) if restore_selection else None
+    if undo_chunk:
+        cmds.undoInfo(openChunk=True)
+
+    was_suspended = cmds.refresh(query=True, suspend=True) if suspend_refresh else True
+    if not was_suspended:
+        cmds.refresh(suspend=True)
+
+    try:
+        yield
+    finally:
+        if not was_suspended:
+            cmds.refresh(suspend=False)
+            cmds.refresh(force=True)
+
+        if restore_selection:
+            if selected:
+                cmds.select(selected, replace=True, noExpand=True)
+            else:
+                cmds.select(clear=True)
+
+        if undo_chunk:
+            cmds.undoInfo(closeChunk=True)
+
+
+def getIcon(icon_name):
+    """ Get icon from resources, loaded from disk only once. """
+    icon = _icons_cache.get(icon_name)
+    if icon is None:
+        icon = QtGui.QIcon(os.path.join(ICONS_DIR, icon_name))
+        _icons_cache[icon_name] = icon
+
+    return icon
+
+
+class _LazyIcon(object):
+    """ Icon class attribute loaded on first access. """
+    def __init__(self, icon_name):
+        self.icon_name = icon_name
+
+    def __get__(self, instance, owner):
+        return getIcon(self.icon_name)
+
+
+class _LazyNames(object):
+    """ Node names for log messages, resolved only if the record is emitted. """
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def __str__(self):
+        return str([node.name() for node in self.nodes])
 
 
 class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
     """ LightToolkit window. """
+    _completion_model = None  # Shared by all instances
+
+    # Stylesheets
+    css_btn_on = "QPushButton{color:rgb(250,220,120)}"
+    css_btn_default = "QPushButton{color:rgb(255,255,255)}"
+    css_color_picker = "QPushButton{background-color:rgb(%d, %d, %d);}"
+    css_optimizer_icon = (
+        "QPushButton#pushButton_Icon{border-radius:20px; background-color: #5d5d5d; border:5px #14E696;} "
+        "QPushButton#pushButton_Icon:hover{border-radius:20px; background-color: #949494; border:5px #14E696;} ")
+    css_align_red = "QPushButton{background-color:rgb(220,80,120); color:rgb(255,200,200); border:none}"
+    css_align_grn = "QPushButton{background:rgb(80,220,120); color:rgb(200,255,200); border:none}"
+    css_align_blu = "QPushButton{background:rgb(80,120,220); color:rgb(200,200,255); border:none}"
+    css_align_default = "QPushButton{background:rgb(97,97,97); color:rgb(255,255,255)}"
+    default_stylesheet = "QPushButton::checked{background-color:rgb(97,97,97); color:rgb(255,255,255); border:none}"
+
+    # Icons
+    icon_blank = _LazyIcon("icon_blank.png")
+    icon_hierarchy_off = _LazyIcon("icon_hierarchy_off.png")
+    icon_hierarchy_on = _LazyIcon("icon_hierarchy_on.png")
+    icon_window_off = _LazyIcon("icon_window_off.png")
+    icon_window_on = _LazyIcon("icon_window_on.png")
+    icon_refresh = _LazyIcon("icon_refresh.png")
+    icon_inverse = _LazyIcon("icon_inverse.png")
+    icon_select = _LazyIcon("icon_select.png")
+    icon_sync_off = _LazyIcon("icon_sync_off.png")
+    icon_sync_on = _LazyIcon("icon_sync_on.png")
+    icon_spotlight = _LazyIcon("spotLight.svg")
+    icon_pointLight = _LazyIcon("pointLight.svg")
+    icon_directionalLight = _LazyIcon("directionalLight.svg")
+    icon_areaLight = _LazyIcon("areaLight.svg")
+    icon_volumeLight = _LazyIcon("volumeLight.svg")
+    icon_ambientLight = _LazyIcon("ambientLight.svg")
+    icon_aiAreaLight = _LazyIcon("aiAreaLight.svg")
+    icon_aiLightPortal = _LazyIcon("aiLightPortal.svg")
+    icon_aiMeshLight = _LazyIcon("aiMeshLight.svg")
+    icon_aiPhotometricLight = _LazyIcon("aiPhotometricLight.svg")
+    icon_aiPhysicalLight = _LazyIcon("aiPhysicalLight.svg")
+    icon_aiSkyDomeLight = _LazyIcon("aiSkyDomeLight.svg")
+
     def __init__(self, parent=None):
         """ Initialize JMLightToolkit """
         super(JMLightToolkit, self).__init__(parent=parent)
@@ -62,10 +205,7 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         self.display_blocker_grp = "displayBlocker_C_001_GRUP"
         self.display_decay_near_grp = "displayDecayNear_C_001_GRUP"
         self.display_decay_far_grp = "displayDecayFar_C_001_GRUP"
-        self.color_picked = [1.0, 1.0, 1.0]  # Maya Color Picker
-        self.css_btn_on = "QPushButton{color:rgb(250,220,120)}"
-        self.css_btn_default = "QPushButton{color:rgb(255,255,255)}"
-        self.default_stylesheet = "QPushButton::checked{background-color:rgb(97,97,97); color:rgb(255,255,255); border:none}"
+        self.color_picked = (1.0, 1.0, 1.0)  # Maya Color Picker
 
         self.lgt_types_default = [
             "pointLight",
@@ -80,6 +220,8 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             "aiPhotometricLight",
             "aiSkyDomeLight" ]
 
+        self.completion_types_arnold = list(self.lgt_types_arnold)
+
         self.lgt_attrs_default = [
             "coneAngle",
             "penumbraAngle",
@@ -119,9 +261,7 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             "aiLensRadius",
             "aiVolumeSamples",
             "aiCastVolumetricShadows",
-            "aiNormalize",
-            "aiShadowColor",
-            "aiShadowDensity" ]
+            "aiShadowColor" ]
 
         self.transform_attrs = [
             "translateX", "translateY", "translateZ",
@@ -138,53 +278,39 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             "aiExposure",
             "intensity" ]
 
+        # Widgets only available with MtoA
+        self.mtoa_widgets = [
+            self.label_mtoaUtils,
+            self.pushButton_arnoldRenderView,
+            self.pushButton_transfertLightFilters,
+            self.pushButton_multiBlocker,
+            self.pushButton_multiDecay,
+            self.pushButton_multiGobo,
+            self.pushButton_displayRadius,
+            self.pushButton_deleteDisplayRadius,
+            self.pushButton_displayBlocker,
+            self.pushButton_deleteDisplayBlocker,
+            self.pushButton_displayNearDecay,
+            self.pushButton_displayFarDecay,
+            self.pushButton_deleteDisplayDecay,
+            self.pushButton_deleteUnusedBlocker,
+            self.pushButton_deleteUnusedDecay ]
+
         # Clear list and sort UI if MtoA is not loaded
         if not pm.pluginInfo("mtoa", q=True, loaded=True):
             self.lgt_types_arnold = []
             self.lgt_attrs_arnold = []
-            self.label_mtoaUtils.hide()
-            self.pushButton_arnoldRenderView.hide()
-            self.pushButton_transfertLightFilters.hide()
-            self.pushButton_multiBlocker.hide()
-            self.pushButton_multiDecay.hide()
-            self.pushButton_multiGobo.hide()
-            self.pushButton_displayRadius.hide()
-            self.pushButton_deleteDisplayRadius.hide()
-            self.pushButton_displayBlocker.hide()
-            self.pushButton_deleteDisplayBlocker.hide()
-            self.pushButton_displayNearDecay.hide()
-            self.pushButton_displayFarDecay.hide()
-            self.pushButton_deleteDisplayDecay.hide()
-            self.pushButton_deleteUnusedBlocker.hide()
-            self.pushButton_deleteUnusedDecay.hide()
+            self.setUpdatesEnabled(False)
+            for widget in self.mtoa_widgets:
+                widget.hide()
+
+            self.setUpdatesEnabled(True)
 
         self.lgt_types = self.lgt_types_default + self.lgt_types_arnold
-        self.lgt_attrs = self.lgt_attrs_default + self.lgt_attrs_arnold
-
-        # Icons
-        getIcon = lambda icon_name : QtGui.QIcon(os.path.join(PROJECT_DIR, "resources", "icons", icon_name))
-        self.icon_blank = getIcon("icon_blank.png")
-        self.icon_hierarchy_off = getIcon("icon_hierarchy_off.png")
-        self.icon_hierarchy_on = getIcon("icon_hierarchy_on.png")
-        self.icon_window_off = getIcon("icon_window_off.png")
-        self.icon_window_on = getIcon("icon_window_on.png")
-        self.icon_refresh = getIcon("icon_refresh.png")
-        self.icon_inverse = getIcon("icon_inverse.png")
-        self.icon_select = getIcon("icon_select.png")
-        self.icon_sync_off = getIcon("icon_sync_off.png")
-        self.icon_sync_on = getIcon("icon_sync_on.png")
-        self.icon_spotlight = getIcon("spotLight.svg")
-        self.icon_pointLight = getIcon("pointLight.svg")
-        self.icon_directionalLight = getIcon("directionalLight.svg")
-        self.icon_areaLight = getIcon("areaLight.svg")
-        self.icon_volumeLight = getIcon("volumeLight.svg")
-        self.icon_ambientLight = getIcon("ambientLight.svg")
-        self.icon_aiAreaLight = getIcon("aiAreaLight.svg")
-        self.icon_aiLightPortal = getIcon("aiLightPortal.svg")
-        self.icon_aiMeshLight = getIcon("aiMeshLight.svg")
-        self.icon_aiPhotometricLight = getIcon("aiPhotometricLight.svg")
-        self.icon_aiPhysicalLight = getIcon("aiPhysicalLight.svg")
-        self.icon_aiSkyDomeLight = getIcon("aiSkyDomeLight.svg")
+        self.lgt_types_set = frozenset(self.lgt_types)
+        self.select_children_types = self.lgt_types_set | frozenset(["mesh"])
+        self.lgt_attrs = tuple(self.lgt_attrs_default + self.lgt_attrs_arnold)
+        self.lgt_attrs_set = frozenset(self.lgt_attrs)
 
         # Connect Methods to UI
         self.pushButton_soloLights.clicked.connect(self.soloLights)
@@ -231,25 +357,22 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         self.pushButton_displayFarDecay.clicked.connect(partial(self.displayDecay, "far"))
         self.pushButton_deleteDisplayDecay.clicked.connect(self.deleteDisplayDecay)
 
-        self.pushButton_colorOutliner_R.clicked.connect(partial(self.colorOutlinerSelected, "red"))
-        self.pushButton_colorOutliner_O.clicked.connect(partial(self.colorOutlinerSelected, "orange"))
-        self.pushButton_colorOutliner_Y.clicked.connect(partial(self.colorOutlinerSelected, "yellow"))
-        self.pushButton_colorOutliner_G.clicked.connect(partial(self.colorOutlinerSelected, "green"))
-        self.pushButton_colorOutliner_T.clicked.connect(partial(self.colorOutlinerSelected, "turquoise"))
-        self.pushButton_colorOutliner_C.clicked.connect(partial(self.colorOutlinerSelected, "cyan"))
-        self.pushButton_colorOutliner_B.clicked.connect(partial(self.colorOutlinerSelected, "blue"))
-        self.pushButton_colorOutliner_P.clicked.connect(partial(self.colorOutlinerSelected, "purple"))
-        self.pushButton_colorOutliner_M.clicked.connect(partial(self.colorOutlinerSelected, "magenta"))
+        outliner_colors = [
+            (self.pushButton_colorOutliner_R, "red", "#FF8080"),
+            (self.pushButton_colorOutliner_O, "orange", "#FFCC50"),
+            (self.pushButton_colorOutliner_Y, "yellow", "#FFFF80"),
+            (self.pushButton_colorOutliner_G, "green", "#90FF70"),
+            (self.pushButton_colorOutliner_T, "turquoise", "#40FFCC"),
+            (self.pushButton_colorOutliner_C, "cyan", "#80FFFF"),
+            (self.pushButton_colorOutliner_B, "blue", "#50BBFF"),
+            (self.pushButton_colorOutliner_P, "purple", "#BB50FF"),
+            (self.pushButton_colorOutliner_M, "magenta", "#FF80FF") ]
+
+        for button, color_name, color_hex in outliner_colors:
+            button.clicked.connect(partial(self.colorOutlinerSelected, color_name))
+            button.setStyleSheet("QPushButton{background-color:%s;}" % color_hex)
+
         self.pushButton_colorOutliner_none.clicked.connect(partial(self.colorOutlinerSelected, "black", False))
-        self.pushButton_colorOutliner_R.setStyleSheet("QPushButton{background-color:#FF8080;}")
-        self.pushButton_colorOutliner_O.setStyleSheet("QPushButton{background-color:#FFCC50;}")
-        self.pushButton_colorOutliner_Y.setStyleSheet("QPushButton{background-color:#FFFF80;}")
-        self.pushButton_colorOutliner_G.setStyleSheet("QPushButton{background-color:#90FF70;}")
-        self.pushButton_colorOutliner_T.setStyleSheet("QPushButton{background-color:#40FFCC;}")
-        self.pushButton_colorOutliner_C.setStyleSheet("QPushButton{background-color:#80FFFF;}")
-        self.pushButton_colorOutliner_B.setStyleSheet("QPushButton{background-color:#50BBFF;}")
-        self.pushButton_colorOutliner_P.setStyleSheet("QPushButton{background-color:#BB50FF;}")
-        self.pushButton_colorOutliner_M.setStyleSheet("QPushButton{background-color:#FF80FF;}")
         self.pushButton_colorOutliner_none.setStyleSheet("QPushButton{background-color:#ffffff;}")
 
         self.pushButton_advancedSelection_select.clicked.connect(self.advancedSelection)
@@ -257,8 +380,14 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         self.groupBox_radio_1.setStyleSheet("QGroupBox{background-color:#444444; border: 0px solid #444444;}")
         self.groupBox_radio_2.setStyleSheet("QGroupBox{background-color:#444444; border: 0px solid #444444;}")
         self.autocompletion = self.lgt_types + ["mesh","aiStandIn"]
+        if JMLightToolkit._completion_model is None:
+            JMLightToolkit._completion_model = QtGui.QStringListModel(self.autocompletion)
+        else:
+            # Plugins may have been (un)loaded while no window was listening
+            JMLightToolkit._completion_model.setStringList(self.autocompletion)
+
         self.completer = QtWidgets.QCompleter()
-        self.completer.setModel(QtGui.QStringListModel(self.autocompletion))
+        self.completer.setModel(JMLightToolkit._completion_model)
         self.lineEdit_advancedSelection_type.setCompleter(self.completer)
         self.lineEdit_advancedSelection_type.insert("mesh,aiStandIn")
 
@@ -281,6 +410,36 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         self.comboBox_lightOptimizer_attributes.currentIndexChanged.connect(self.__lightOptimizer__adaptSlider)
         self.pushButton_lightOptimizer_sync.clicked.connect(self.__lightOptimizer__toggleSync)
 
+        # Optimizer repopulate after a row edit, restarted by each edit so a burst repopulates once
+        self._optimizer_timer = QtCore.QTimer(self)
+        self._optimizer_timer.setSingleShot(True)
+        self._optimizer_timer.setInterval(150)
+        self._optimizer_timer.timeout.connect(self.__lightOptimizer__populateGrid)
+        self._optimizer_size_hint = None
+
+        # Optimizer rows get their widget only once scrolled into view, icon buttons styled once from the list
+        self.listWidget_lightOptimizer.setStyleSheet(self.css_optimizer_icon)
+        self.listWidget_lightOptimizer.setUniformItemSizes(True)
+        self.listWidget_lightOptimizer.verticalScrollBar().valueChanged.connect(self.__lightOptimizer__buildVisibleItems)
+        self.listWidget_lightOptimizer.verticalScrollBar().rangeChanged.connect(self.__lightOptimizer__buildVisibleItems)
+
+        # Scene lights cache, dropped when a light is created or deleted
+        self._all_lights_cache = None
+        self._callback_ids = []
+        for lgt_type in self.lgt_types:
+            self._callback_ids.append(om2.MDGMessage.addNodeAddedCallback(self._clearLightsCache, lgt_type))
+            self._callback_ids.append(om2.MDGMessage.addNodeRemovedCallback(self._clearLightsCache, lgt_type))
+
+        self._callback_ids.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterNew, self._clearLightsCache))
+        self._callback_ids.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterOpen, self._clearLightsCache))
+
+        # Keep completion in sync with MtoA plugin state
+        self._callback_ids.append(om2.MSceneMessage.addStringArrayCallback(om2.MSceneMessage.kAfterPluginLoad, self._refreshCompletionModel))
+        self._callback_ids.append(om2.MSceneMessage.addStringArrayCallback(om2.MSceneMessage.kAfterPluginUnload, self._refreshCompletionModel))
+
+        # Looked through camera, kept up to date by lookThrough
+        self._current_lookthrough = self._isLookThrough()
+
         # Pre-build Methods
         self.__populateComboBoxAttributes()
         self.__lightOptimizer__populateComboBox()
@@ -297,31 +456,57 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         if event.key() == QtCore.Qt.Key_Shift:
             pass
 
+    def dockCloseEventTriggered(self):
+        """ Close event. """
+        self.removeCallbacks()
+
+    def removeCallbacks(self):
+        """ Remove Maya callbacks registered by the window. """
+        for callback_id in self._callback_ids:
+            om2.MMessage.removeCallback(callback_id)
+
+        self._callback_ids = []
+
+    def _clearLightsCache(self, *args):
+        """ Invalidate '_getAllLights' cache. """
+        self._all_lights_cache = None
+
+    def _refreshCompletionModel(self, *args):
+        """ Refresh advanced selection completion after a plugin is loaded or unloaded. """
+        lgt_types = list(self.lgt_types_default)
+        if pm.pluginInfo("mtoa", q=True, loaded=True):
+            lgt_types.extend(self.completion_types_arnold)
+
+        autocompletion = lgt_types + ["mesh","aiStandIn"]
+        if autocompletion != self.autocompletion:
+            self.autocompletion = autocompletion
+            self._completion_model.setStringList(self.autocompletion)
+
     def _wrapperUndoChunck(function):
         """ Create an undo Chunk and wrap it. """
         def wrapper(self, *args, **kwargs):
-            try:
-                pm.undoInfo(openChunk=True)
-                function(self, *args, **kwargs)
-            finally:
-                pm.undoInfo(closeChunk=True)
+            with undoScope():
+                return function(self, *args, **kwargs)
 
         return wrapper
 
-    def _wrapperSelected(function):
-        """ Recover selection. """
+    def _wrapperUndoSelected(function):
+        """ Create an undo Chunk, wrap it then recover selection. """
         def wrapper(self, *args, **kwargs):
-            selected = None
-            try:
-                selected = pm.selected()
-                function(self, *args, **kwargs)
-            finally:
-                pm.select(selected)
+            with undoScope(restore_selection=True):
+                return function(self, *args, **kwargs)
 
         return wrapper
 
-    @_wrapperUndoChunck
-    @_wrapperSelected
+    def _wrapperSuspendRefresh(function):
+        """ Suspend viewport refresh during bulk scene edits. """
+        def wrapper(self, *args, **kwargs):
+            with undoScope(undo_chunk=False, suspend_refresh=True):
+                return function(self, *args, **kwargs)
+
+        return wrapper
+
+    @_wrapperUndoSelected
     def soloLights(self):
         """ Put lights selected in 'displayed lights' display layer.
 
@@ -336,27 +521,20 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         if not lights["displayed"]:
             return None
 
-        # Get unselected lights
-        all_lights = self._getAllLights()
-        lights["muted"] = list(set(all_lights).difference(lights["displayed"]))
+        # Get unselected lights, compared by long names
+        displayed_names = [lgt.longName() for lgt in lights["displayed"]]
+        displayed_set = set(displayed_names)
+        lights["muted"] = [name for name in (lgt.longName() for lgt in self._getAllLights()) if name not in displayed_set]
 
         # Create Display layer
-        pm.select(clear=True)
-        muted_layer = pm.createDisplayLayer(n=self.muted_layer_name)
-        muted_layer.addMembers(lights["muted"])
-        muted_layer.color.set(21)
-        muted_layer.visibility.set(0)
-
-        displayed_layer = pm.createDisplayLayer(n=self.displayed_layer_name)
-        displayed_layer.addMembers(lights["displayed"])
-        displayed_layer.color.set(22)
+        self._createDisplayLayer(self.muted_layer_name, lights["muted"], color=21, visibility=False)
+        self._createDisplayLayer(self.displayed_layer_name, displayed_names, color=22)
 
         self.__soloMuteLightsCSS()
-        _logger.info("Lights displayed : %s" % [lgt.name() for lgt in lights["displayed"]])
+        _logger.info("Lights displayed : %s", _LazyNames(lights["displayed"]))
         return lights["displayed"]
 
-    @_wrapperUndoChunck
-    @_wrapperSelected
+    @_wrapperUndoSelected
     def muteLights(self):
         """ Put lights selected in 'muted lights' display layer.
 
@@ -371,32 +549,22 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             return None
 
         # Create Display layer either get it
-        if pm.objExists(self.muted_layer_name):
-            pm.PyNode(self.muted_layer_name).addMembers(lights)
+        light_names = [lgt.name() for lgt in lights]
+        if cmds.objExists(self.muted_layer_name):
+            cmds.editDisplayLayerMembers(self.muted_layer_name, light_names, noRecurse=True)
         else:
-            pm.select(clear=True)
-            muted_layer = pm.createDisplayLayer(n=self.muted_layer_name)
-            muted_layer.addMembers(lights)
-            muted_layer.color.set(21)
-            muted_layer.visibility.set(0)
+            self._createDisplayLayer(self.muted_layer_name, light_names, color=21, visibility=False)
 
         self.__soloMuteLightsCSS()
-        _logger.info("Lights muted : %s" % [lgt.name() for lgt in lights])
+        _logger.info("Lights muted : %s", _LazyNames(lights))
         return lights
 
     @_wrapperUndoChunck
     def restoreLights(self):
         """ Delete Displayed/Muted display layer. """
-        something_deleted = False
-        if pm.objExists(self.displayed_layer_name):
-            pm.delete(self.displayed_layer_name)
-            something_deleted = True
-
-        if pm.objExists(self.muted_layer_name):
-            pm.delete(self.muted_layer_name)
-            something_deleted = True
-
-        if something_deleted:
+        existing_layers = cmds.ls([self.displayed_layer_name, self.muted_layer_name])
+        if existing_layers:
+            cmds.delete(existing_layers)
             self.__soloMuteLightsCSS()
             _logger.info("Lights visibilities restored.")
             return True
@@ -405,84 +573,84 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
     def __soloMuteLightsCSS(self):
         """ Solo/Mute Lights look. """
-        if pm.objExists(self.displayed_layer_name):
-            self.pushButton_soloLights.setStyleSheet(self.css_btn_on)
+        if cmds.objExists(self.displayed_layer_name):
+            self._setStyleSheet(self.pushButton_soloLights, self.css_btn_on)
         else:
-            self.pushButton_soloLights.setStyleSheet(self.css_btn_default)
+            self._setStyleSheet(self.pushButton_soloLights, self.css_btn_default)
 
-        if pm.objExists(self.muted_layer_name):
-            self.pushButton_muteLights.setStyleSheet(self.css_btn_on)
+        if cmds.objExists(self.muted_layer_name):
+            self._setStyleSheet(self.pushButton_muteLights, self.css_btn_on)
         else:
-            self.pushButton_muteLights.setStyleSheet(self.css_btn_default)
+            self._setStyleSheet(self.pushButton_muteLights, self.css_btn_default)
 
     def __hierarchyCSS(self):
         """ Stylize hierarchy button """
         if self.pushButton_soloLights_hierarchy.isChecked():
-            self.pushButton_soloLights_hierarchy.setStyleSheet(self.default_stylesheet)
+            self._setStyleSheet(self.pushButton_soloLights_hierarchy, self.default_stylesheet)
             self.pushButton_soloLights_hierarchy.setIcon(self.icon_hierarchy_on)
 
         else:
-            self.pushButton_soloLights_hierarchy.setStyleSheet(self.default_stylesheet)
+            self._setStyleSheet(self.pushButton_soloLights_hierarchy, self.default_stylesheet)
             self.pushButton_soloLights_hierarchy.setIcon(self.icon_hierarchy_off)
 
     def getPanels(self):
         """ Get current viewport panel. """
-        # Get Panel, if persp found, throught this cam
-        all_panels = [ui for ui in pm.getPanel(vis=True) if "modelPanel" in ui.name()]
-        current_panel = None
+        # Visible model panels only, in visible order
+        model_panels = set(cmds.getPanel(type="modelPanel") or [])
+        all_panels = [panel for panel in cmds.getPanel(visiblePanels=True) or [] if panel in model_panels]
+        if not all_panels:
+            return None
+
+        # Get Panel, if persp found, throught this cam, else modelPanel4, else last one
+        fallback_panel = None
         for panel in all_panels:
-            if "persp" in pm.windows.modelPanel(panel, query=True, camera=True):
-                current_panel = panel
-                break
-
-        else:  # if modelPanel4 find, throught this cam
-            for panel in all_panels:
-                if panel.name() == "modelPanel4":
-                    current_panel = panel
-                    break
-            else:
-                current_panel = all_panels[-1]
-        
-        return current_panel
+            if "persp" in cmds.modelPanel(panel, query=True, camera=True):
+                return panel
 
+            if panel == "modelPanel4":
+                fallback_panel = panel
+
+        return fallback_panel or all_panels[-1]
 
     @_wrapperUndoChunck
     def lookThrough(self):
         """ Light lookthrough. """
         # Get panels 
         current_panel = self.getPanels()
+        if current_panel is None:
+            _logger.warning("No visible model panel")
+            return None
 
         # If already Through, delete cam
-        looked_through = self._isLookThrough()
+        looked_through = self._getLookThrough()
         if looked_through is not None:
             pm.delete(looked_through)
+            self._current_lookthrough = None
             self.__lookThroughCSS()
 
             # Looktrough persp
             persp_cam = [cam for cam in  pm.ls(ca=True) if "persp" in cam.name()]
             if persp_cam:
                 persp_cam = persp_cam[0].getParent().name()
-                cmd = "lookThroughModelPanelClipped(\"" + persp_cam + "\", \"" + current_panel + "\", 0.001, 10000)"
-                pm.mel.eval(cmd)
+                pm.mel.lookThroughModelPanelClipped(persp_cam, current_panel, 0.001, 10000)
 
             return
 
         # Return is no light found in selection
-        if not self._onlyLightsFromSelection():
+        lights = self._onlyLightsFromSelection()
+        if not lights:
             return None
 
         # Look Through Window
         if self.pushButton_lookThroughWindow.isChecked():
-            createLookThroughWindow()
+            createLookThroughWindow(lights)
             return
 
         # See Trough
-        lights = self._onlyLightsFromSelection()
-        if lights:
-            light =  lights[0].name()
-            cmd = "lookThroughModelPanelClipped(\"" + light + "\", \"" + current_panel + "\", 0.001, 10000)"
-            pm.mel.eval(cmd)
-            _logger.info("Look through : %s" % light)
+        light =  lights[0].name()
+        pm.mel.lookThroughModelPanelClipped(light, current_panel, 0.001, 10000)
+        self._current_lookthrough = (cmds.listRelatives(light, shapes=True, type="camera", fullPath=True) or [None])[0]
+        _logger.info("Look through : %s" % light)
 
         self.__lookThroughCSS()
 
@@ -490,36 +658,41 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         """ Get looked through camera.
 
             Returns:
-                (camera): looked through camera
+                (str): looked through camera
         """
-        looked_through = None
-        for cam in pm.ls(ca=True):
-            shape = cam.getParent().getShape()
-            if shape is None:
-                continue
+        # Look for cameras under light transforms instead of walking every camera
+        light_shapes = cmds.ls(type=self.lgt_types, long=True)
+        parents = cmds.listRelatives(light_shapes, parent=True, fullPath=True) if light_shapes else None
+        cameras = cmds.listRelatives(parents, shapes=True, type="camera", fullPath=True) if parents else None
+        return cameras[0] if cameras else None
+
+    def _getLookThrough(self):
+        """ Get looked through camera, scene is scanned only if the last known one is gone.
 
-            if pm.nodeType(shape) in self.lgt_types:
-                looked_through = cam
-                break
+            Returns:
+                (str): looked through camera
+        """
+        if not (self._current_lookthrough and cmds.objExists(self._current_lookthrough)):
+            self._current_lookthrough = self._isLookThrough()
 
-        return looked_through
+        return self._current_lookthrough
 
     def __lookThroughCSS(self):
         """ Stylize lookthrough button. """
         # Window icon
         if self.pushButton_lookThroughWindow.isChecked():
-            self.pushButton_lookThroughWindow.setStyleSheet(self.default_stylesheet)
+            self._setStyleSheet(self.pushButton_lookThroughWindow, self.default_stylesheet)
             self.pushButton_lookThroughWindow.setIcon(self.icon_window_on)
 
         else:
-            self.pushButton_lookThroughWindow.setStyleSheet(self.default_stylesheet)
+            self._setStyleSheet(self.pushButton_lookThroughWindow, self.default_stylesheet)
             self.pushButton_lookThroughWindow.setIcon(self.icon_window_off)
 
-        # Stylize button
-        if self._isLookThrough() is not None:
-            self.pushButton_lookThrough.setStyleSheet(self.css_btn_on)
+        # Stylize button, camera may have been deleted by undo or by hand
+        if self._getLookThrough() is not None:
+            self._setStyleSheet(self.pushButton_lookThrough, self.css_btn_on)
         else:
-            self.pushButton_lookThrough.setStyleSheet(self.css_btn_default)
+            self._setStyleSheet(self.pushButton_lookThrough, self.css_btn_default)
 
     @_wrapperUndoChunck
     def quickAlign(self):
@@ -546,17 +719,17 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
         master = selected[-1]
         slaves = selected[:-1]
-        if t_:  # Match translation
-            for slave in slaves :
-                pm.matchTransform(slave, master, position=True)
-
-        if r_:  # Match rotation
-            for slave in slaves :
-                pm.matchTransform(slave, master, rotation=True)
+        # Match only checked channels, in one call per slave
+        match_flags = {}
+        if t_:
+            match_flags["position"] = True
+        if r_:
+            match_flags["rotation"] = True
+        if s_:
+            match_flags["scale"] = True
 
-        if s_:  # Match scale
-            for slave in slaves :
-                pm.matchTransform(slave, master, scale=True)
+        for slave in slaves:
+            pm.matchTransform(slave, master, **match_flags)
 
         pm.select(slaves)
         _logger.info("%s aligned to %s" % (slaves, master))
@@ -564,26 +737,14 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
     def __quickAlignCSS(self):
         """ Stylize XYZ quick align buttons """
-        # CSS preset
-        red_stylesheet = "QPushButton{background-color:rgb(220,80,120); color:rgb(255,200,200); border:none}"
-        grn_stylesheet = "QPushButton{background:rgb(80,220,120); color:rgb(200,255,200); border:none}"
-        blu_stylesheet = "QPushButton{background:rgb(80,120,220); color:rgb(200,200,255); border:none}"
-        default_stylesheet = "QPushButton{background:rgb(97,97,97); color:rgb(255,255,255)}"
+        # Stylize, each button gets its stylesheet only once
+        buttons = [
+            (self.pushButton_quickAlign_T, self.css_align_red),
+            (self.pushButton_quickAlign_R, self.css_align_grn),
+            (self.pushButton_quickAlign_S, self.css_align_blu) ]
 
-        # Reset style
-        self.pushButton_quickAlign_T.setStyleSheet(default_stylesheet)
-        self.pushButton_quickAlign_R.setStyleSheet(default_stylesheet)
-        self.pushButton_quickAlign_S.setStyleSheet(default_stylesheet)
-
-        # Stylize
-        if self.pushButton_quickAlign_T.isChecked():
-            self.pushButton_quickAlign_T.setStyleSheet(red_stylesheet)
-
-        if self.pushButton_quickAlign_R.isChecked():
-            self.pushButton_quickAlign_R.setStyleSheet(grn_stylesheet)
-
-        if self.pushButton_quickAlign_S.isChecked():
-            self.pushButton_quickAlign_S.setStyleSheet(blu_stylesheet)
+        for button, css_checked in buttons:
+            self._setStyleSheet(button, css_checked if button.isChecked() else self.css_align_default)
 
     def selectAllLights(self):
         """ Select all standard/Arnold lights from scene """
@@ -593,21 +754,22 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
     def getMultiAttributesLights(self):
         """ Get multi attributes on a group of lights selected """
-        lights = self._onlyLightsFromSelection()
+        lights = self._onlyLightsFromSelection(get_shapes=True)
         if not lights:
             return None
 
-        num_lights = len(lights)
-        attributes_kept = []
+        # Probe attributes through API instead of one 'objExists' per light and attribute
+        selection_list = om2.MSelectionList()
+        for light in lights:
+            selection_list.add(light.name())
 
-        for attr_ in self.lgt_attrs:
-            attr_exist = 0
-            for light in lights:
-                if pm.objExists("%s.%s" % (light, attr_)):
-                    attr_exist += 1
+        # Lights of a same type share their attributes, probe one light per type
+        nodes_fn = {}
+        for i in range(selection_list.length()):
+            node_fn = om2.MFnDependencyNode(selection_list.getDependNode(i))
+            nodes_fn.setdefault(node_fn.typeName, node_fn)
 
-                if attr_exist == num_lights:
-                    attributes_kept.append(attr_)
+        attributes_kept = [attr_ for attr_ in self.lgt_attrs if all(node_fn.hasAttribute(attr_) for node_fn in nodes_fn.values())]
 
         # Populate Attrs Combo box
         self.comboBox_multiAttr.clear()
@@ -645,31 +807,34 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         value = self.doubleSpinBox_multiAttr.value()
 
         # Light Attributes
-        if attr_ in self.lgt_attrs:
-            for light in lights:
-                if pm.objExists("%s.%s" % (light, attr_)):
-                    if mode == "absolute":
-                        pm.setAttr("%s.%s" % (light, attr_), value)
-                    elif mode == "relative":
-                        current_value = pm.getAttr("%s.%s" % (light, attr_))
-                        pm.setAttr("%s.%s" % (light, attr_), value + current_value)
-                else:
-                    _logger.warning("%s.%s doesn't exist" % (light, attr_))
+        if attr_ in self.lgt_attrs_set:
+            nodes = [light.name() for light in lights]
 
         # Transform Attributes
         else:  # attr_ in self.transform_data
-            for selected in pm.selected():
-                if pm.nodeType(selected.name()) != "transform":
-                    selected = selected.getParent()
-
-                if pm.objExists("%s.%s" % (selected, attr_)):
-                    if mode == "absolute":
-                        pm.setAttr("%s.%s" % (selected, attr_), value)
-                    elif mode == "relative":
-                        current_value = pm.getAttr("%s.%s" % (selected, attr_))
-                        pm.setAttr("%s.%s" % (selected, attr_), value + current_value)
-                else:
-                    _logger.warning("%s.%s doesn't exist" % (selected, attr_))
+            nodes = cmds.ls(sl=True, type="transform")
+            shapes = cmds.ls(sl=True, shapes=True)
+            if shapes:
+                nodes.extend(cmds.listRelatives(shapes, parent=True, path=True))
+
+        # Sort existing plugs first, missing ones are logged once
+        plugs = []
+        missing = []
+        for node in nodes:
+            plug = "%s.%s" % (node, attr_)
+            (plugs if cmds.objExists(plug) else missing).append(plug)
+
+        if missing:
+            _logger.warning("%s doesn't exist" % missing)
+
+        # Read all current values before writing any
+        if mode == "relative":
+            values = [value + cmds.getAttr(plug) for plug in plugs]
+        else:
+            values = [value] * len(plugs)
+
+        for plug, plug_value in zip(plugs, values):
+            cmds.setAttr(plug, plug_value)
 
         _logger.info("'Multi set attributes' success")
         return {"lights" : lights, "attribute" : attr_, "value" : value}
@@ -708,10 +873,8 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         cursor_position = QtGui.QCursor.pos()
 
         # Pick color
-        self.color_picked = pm.cmds.colorEditor(mini=True, rgb=save_color, pos=(cursor_position.x(), cursor_position.y()))
-        self.color_picked = [color for color in self.color_picked.split(" ") if color]
-        self.color_picked = [float(color) for color in self.color_picked]
-        self.color_picked = self.color_picked[:-1]
+        color_editor = pm.cmds.colorEditor(mini=True, rgb=save_color, pos=(cursor_position.x(), cursor_position.y()))
+        self.color_picked = tuple(float(color) for color in color_editor.split()[:3])
 
         if not self.color_picked[0] and not self.color_picked[1] and not self.color_picked[2]:
             self.color_picked = save_color
@@ -719,18 +882,23 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         color_R = self.color_picked[0] * 255.0
         color_G = self.color_picked[1] * 255.0
         color_B = self.color_picked[2] * 255.0
-        color = "{0}, {1}, {2}".format(color_R, color_G, color_B)
 
-        self.pushButton_colorPicker.setStyleSheet("QPushButton{background-color:rgb(%s);}" % color)
-        _logger.info("R=%s G=%s B=%s" % (self.color_picked[0], self.color_picked[1], self.color_picked[2]))
+        self._setStyleSheet(self.pushButton_colorPicker, self.css_color_picker % (color_R, color_G, color_B))
+        _logger.info("R=%s G=%s B=%s" % self.color_picked)
         return self.color_picked
 
     @_wrapperUndoChunck
     def setColorPicked(self):
         """ Set lights color. """
-        for light in self._onlyLightsFromSelection():
-            pm.setAttr("%s.color" % light, self.color_picked)
-            _logger.info("Color : %s" % self.color_picked)
+        lights = self._onlyLightsFromSelection(get_shapes=True)
+        if not lights:
+            return None
+
+        color_R, color_G, color_B = self.color_picked
+        for light in lights:
+            cmds.setAttr("%s.color" % light.name(), color_R, color_G, color_B, type="double3")
+
+        _logger.info("Color : %s, %s, %s" % self.color_picked)
 
     @_wrapperUndoChunck
     def transfertLightAttrs(self):
@@ -742,37 +910,55 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
         driver = lights[0]
         slaves = lights[1:]
-        copy_attr = None
 
+        # Resolve names once instead of per attribute
+        driver_name = driver.name()
+        slaves_name = [slave.name() for slave in slaves]
+
+        # Copy attributes, existing ones are listed once per light
+        driver_attrs = set(cmds.listAttr(driver_name) or [])
+        copy_attrs = []
         for attr_ in self.lgt_attrs:
-            # Copy attributes
-            if pm.objExists("%s.%s" % (driver, attr_)):
-                copy_attr = pm.getAttr("%s.%s" % (driver, attr_))
-            else:
+            if attr_ not in driver_attrs:
                 continue
 
-            # Set attributes
-            for slave in slaves:
-                if pm.objExists("%s.%s" % (slave, attr_)):
-                    pm.setAttr("%s.%s" % (slave, attr_), copy_attr)
+            value = cmds.getAttr("%s.%s" % (driver_name, attr_))
+            if isinstance(value, list):  # Compound attributes, [(r, g, b)]
+                value = value[0]
+
+            copy_attrs.append((attr_, value))
+
+        # Set attributes
+        for slave_name in slaves_name:
+            slave_attrs = set(cmds.listAttr(slave_name) or [])
+            for attr_, value in copy_attrs:
+                if attr_ not in slave_attrs:
+                    continue
+
+                if isinstance(value, tuple):
+                    cmds.setAttr("%s.%s" % (slave_name, attr_), *value)
+                else:
+                    cmds.setAttr("%s.%s" % (slave_name, attr_), value)
 
         pm.select(slaves)
-        _logger.info("%s attributes transfered to %s" % (driver.name(), [node.name() for node in slaves]))
+        _logger.info("%s attributes transfered to %s" % (driver_name, slaves_name))
         return True
 
     @_wrapperUndoChunck
     def createSet(self):
         """ Create Set then put transform node selected. """
         # GET SELECTED
-        include_type = ["mesh", "aiStandIn", "pgYetiMaya"]
-        selected = pm.selected()
-        pre_setname = selected[-1].name().split("_")[0]
+        include_type = [typ for typ in _LINKABLE_TYPES if cmds.nodeType(typ, isTypeName=True)]
+        selected = cmds.ls(sl=True)
+        if not selected:
+            _logger.warning("Nothing selected")
+            return None
 
-        shapes = []
-        for node in selected:
-            shapes.extend([node for node in node.getChildren(ad=True, s=True) if pm.nodeType(node.name()) in include_type])
+        pre_setname = selected[-1].split("|")[-1].split("_")[0]
 
-        transforms = [shape.getParent() for shape in shapes]
+        # Let Maya filter descendant shapes by type in one call
+        shapes = cmds.listRelatives(selected, allDescendents=True, shapes=True, type=include_type, fullPath=True)
+        transforms = cmds.listRelatives(shapes, parent=True, fullPath=True) if shapes else []
 
         if not transforms:
             _logger.warning("Invalid selection")
@@ -796,90 +982,87 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             return None
 
         # ROOT SET
-        if pm.objExists("root_SETS"):
-            root_set = pm.PyNode("root_SETS")
-        else:
-            pm.select(cl=True)
-            root_set = pm.sets(n="root_SETS")
+        root_set = "root_SETS"
+        if not cmds.objExists(root_set):
+            root_set = cmds.sets(name=root_set, empty=True)
 
         # CREATE SET
         if re.search(r'[A-Za-z0-9_]+(_SETS)', input_) is None:
             input_ = "%s_SET" % input_
 
-        pm.select(cl=True)
-        set_ = pm.sets(n=input_)
-        set_.addMembers(transforms)
-        pm.sets(root_set, fe=set_)
+        # Members are added by path in the creation call
+        set_ = cmds.sets(transforms, name=input_)
+        cmds.sets(set_, edit=True, forceElement=root_set)
 
-        pm.select(selected)
+        cmds.select(selected)
         _logger.info("%s" % set_)
         return set_
 
-    @_wrapperSelected
     def makeLightLinks(self):
-        """ cmds.MakeLightLinks Maya Command. Link only to transform. """
-        selected = pm.selected()
-        set_children = []
-        for node in selected:
-            if pm.nodeType(node) == "objectSet":
-                set_children.extend(node.members(True))
-                selected.remove(node)
+        """ cmds.MakeLightLinks Maya Command, without selection change. Link only to transform. """
+        lights, objects = self._splitLightsObjects(self._getSetsMembers())
+        if not lights or not objects:
+            _logger.warning("Select lights and objects")
+            return None
 
-        pm.select(selected)
-        pm.select(set_children, add=True)
-        pm.cmds.MakeLightLinks()
+        cmds.lightlink(make=True, light=lights, object=objects)
         _logger.info("lights linked")
+        return True
 
-    @_wrapperSelected
     def breakLightLinks(self):
-        """ cmds.BreakLightLinks Maya Command """
-        selected = pm.selected()
-        set_children = []
-        for node in selected:
-            if pm.nodeType(node) == "objectSet":
-                set_children.extend(node.members(True))
-                selected.remove(node)
+        """ cmds.BreakLightLinks Maya Command, without selection change. """
+        lights, objects = self._splitLightsObjects(self._getSetsMembers())
+        if not lights or not objects:
+            _logger.warning("Select lights and objects")
+            return None
 
-        pm.select(selected)
-        pm.select(set_children, add=True)
-        pm.cmds.BreakLightLinks()
+        cmds.lightlink(b=True, light=lights, object=objects)
         _logger.info("lights breaked")
+        return True
 
     def selectLinked(self):
         """ Toggle function between:
             pm.cmds.SelectLightsIlluminatingObject()
             pm.cmds.SelectObjectsIlluminatedByLight()
         """
-        selected = pm.selected()
-        if not selected:
+        selected_shapes = self._selectedShapes()
+        if not selected_shapes:
             _logger.warning("Nothing selected")
             return None
 
-        if pm.nodeType(pm.selected()[0].getShape().name()) in self.lgt_types:
+        selected = cmds.ls(sl=True)
+        if selected_shapes[0][1] in self.lgt_types_set:
             pm.cmds.SelectObjectsIlluminatedByLight()
-            if not pm.selected():
-                _logger.warning("%s illuminate nothing" % [node.name() for node in selected])
-                pm.select(selected)
+            linked = cmds.ls(sl=True)
+            if not linked:
+                _logger.warning("%s illuminate nothing" % selected)
+                cmds.select(selected)
                 return None
         else:
             pm.cmds.SelectLightsIlluminatingObject()
-            if not pm.selected():
-                _logger.warning("%s is not illuminated" % [node.name() for node in selected])
-                pm.select(selected)
+            linked = cmds.ls(sl=True)
+            if not linked:
+                _logger.warning("%s is not illuminated" % selected)
+                cmds.select(selected)
                 return None
 
-        _logger.info("link : %s " % [node.name() for node in pm.selected()])
+        _logger.info("link : %s " % linked)
         return selected
 
+    @_wrapperUndoChunck
     def breakAllLinks(self):
         """ Unlink lights from all """
         lights = self._onlyLightsFromSelection()
+        if not lights:
+            return None
+
         for light in lights:
-            object_linked = pm.lightlink(q=True, light=light)
-            pm.lightlink(light=light, object=object_linked, b=True)
+            object_linked = cmds.lightlink(query=True, light=light.name())
+            if object_linked:
+                cmds.lightlink(b=True, light=light.name(), object=object_linked)
 
-        _logger.info("%s breaked from all" % [node.name() for node in lights])
-        return light
+        _logger.info("%s breaked from all", _LazyNames(lights))
+        return lights
 
     @_wrapperUndoChunck
     def transfertLightLinks(self):
@@ -899,17 +1082,22 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         driver = lights[0]
         slaves = lights[1:]
 
-        type_ = ["mesh", "aiStandIn", "pgYetiMaya"]
-        object_linked = pm.lightlink(q=True, light=driver)
-        sorted_link = [shape for shape in object_linked if pm.nodeType(shape) in type_]
+        object_linked = cmds.lightlink(query=True, light=driver.name())
+        # Filter linked shapes by type in one call, only with registered types
+        include_type = [typ for typ in _LINKABLE_TYPES if cmds.nodeType(typ, isTypeName=True)]
+        sorted_link = cmds.ls(object_linked, type=include_type) if object_linked else []
 
         for slave in slaves:
-            object_linked = pm.lightlink(light=slave)
-            pm.lightlink(light=slave, object=object_linked, b=True)
-            pm.lightlink(light=slave, object=sorted_link, m=True)
+            slave_name = slave.name()
+            object_linked = cmds.lightlink(query=True, light=slave_name)
+            if object_linked:
+                cmds.lightlink(b=True, light=slave_name, object=object_linked)
+
+            if sorted_link:
+                cmds.lightlink(make=True, light=slave_name, object=sorted_link)
 
         pm.select(slaves)
-        _logger.info("Link from %s copyied to %s" % (driver.name(), [slave.name() for slave in slaves]))
+        _logger.info("Link from %s copyied to %s", driver, _LazyNames(slaves))
         return True
 
     def openArnoldRenderView(self):
@@ -929,38 +1117,28 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
         driver = lights[0]
         slaves = lights[1:]
-        copy_attr = None
 
-        # Get driver connection
-        i = 0
-        driver_connection = {}
-        is_connected = pm.connectionInfo("%s.aiFilters[%s]" % (driver, i), id=True)
-        while is_connected:
-            driver_connection["aiFilters[%s]" % i] = pm.connectionInfo("%s.aiFilters[%s]" % (driver, i), sfd=True).split(".")[0]
-            i += 1
-            is_connected = pm.connectionInfo("%s.aiFilters[%s]" % (driver, i), id=True)
+        # Get driver connection, listed as [filter plug, source plug, ...] pairs
+        connections = cmds.listConnections("%s.aiFilters" % driver, source=True, destination=False, connections=True, plugs=True) or []
+        driver_connection = [(filter_plug.split(".", 1)[1], source_plug) for filter_plug, source_plug in zip(connections[::2], connections[1::2])]
 
         if not driver_connection:
-            _logger.warning("%s don't have any light filters")
+            _logger.warning("%s don't have any light filters" % driver.name())
             return None
 
         # Disconnect all light filters from the others lights
-        lenght = len(driver_connection)
         for slave in slaves:
-            i = 0
-            is_connected = pm.connectionInfo("%s.aiFilters[%s]" % (slave, i), id=True)
-            while is_connected:
-                slave_connection = pm.connectionInfo("%s.aiFilters[%s]" % (slave, i), sfd=True)
-                pm.PyNode(slave_connection) // pm.PyNode("%s.aiFilters[%s]" % (slave, i))
-                i += 1
-                is_connected = pm.connectionInfo("%s.aiFilters[%s]" % (slave, i), id=True)
+            slave_name = slave.name()
+            connections = cmds.listConnections("%s.aiFilters" % slave_name, source=True, destination=False, connections=True, plugs=True) or []
+            for filter_plug, source_plug in zip(connections[::2], connections[1::2]):
+                cmds.disconnectAttr(source_plug, filter_plug)
 
             # Connect filters
-            for key, value in driver_connection.items():
-                pm.PyNode("%s.message" % value) >> pm.PyNode("%s.%s" % (slave.name(), key))
+            for filter_attr, source_plug in driver_connection:
+                cmds.connectAttr(source_plug, "%s.%s" % (slave_name, filter_attr))
 
         pm.select(slaves)
-        _logger.info("%s light filters transfered to %s" % (driver.name(), [node.name() for node in slaves]))
+        _logger.info("%s light filters transfered to %s", driver, _LazyNames(slaves))
         return driver_connection
 
     @_wrapperUndoChunck
@@ -978,20 +1156,12 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         # Sort lights and filters
         lights_selected = []
         filter_selected = []
-        for selected in pm.selected():
-            if pm.nodeType(selected.name()) == "transform":
-                if pm.nodeType(selected.getShape().name()) in self.lgt_types:
-                    lights_selected.append(selected.getShape())
+        for shape, shape_type in self._selectedShapes():
+            if shape_type in self.lgt_types_set:
+                lights_selected.append(pm.PyNode(shape))
 
-                elif pm.nodeType(selected.getShape().name()) == filter_:
-                    filter_selected.append(selected.getShape())
-
-            else:  # if selected != transform
-                if pm.nodeType(selected.name()) in self.lgt_types:
-                    lights_selected.append(selected)
-
-                elif pm.nodeType(selected.name()) == filter_:
-                    filter_selected.append(selected)
+            elif shape_type == filter_:
+                filter_selected.append(pm.PyNode(shape))
 
         # Return if no lights selected
         if not lights_selected:
@@ -1002,6 +1172,14 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         if not filter_selected:
             filter_selected = [pm.createNode(filter_)]
 
+        # Get inputs and connected filter indices once per light
+        lights_inputs = {}
+        lights_indices = {}
+        for lgt in lights_selected:
+            connections = cmds.listConnections("%s.aiFilters" % lgt.name(), source=True, destination=False, connections=True, plugs=True) or []
+            lights_indices[lgt] = set(int(_AIFILTER_IDX_RE.search(plug).group(1)) for plug in connections[::2])
+            lights_inputs[lgt] = set(lgt.inputs())
+
         # Link filter to lights
         for filtr in filter_selected:
             try:
@@ -1010,39 +1188,63 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
                 transform_filter = filtr
 
             for lgt in lights_selected:
-                if (filtr not in lgt.inputs()) and (transform_filter not in lgt.inputs()):
-                    i = 0
-                    info = pm.connectionInfo("%s.aiFilters[%s]" % (lgt, i), id=True)
+                inputs = lights_inputs[lgt]
+                if filtr in inputs or transform_filter in inputs:
+                    continue
 
-                    while info :
-                        i += 1
-                        info = pm.connectionInfo("%s.aiFilters[%s]" % (lgt, i), id=True)
+                # Take the first free index
+                indices = lights_indices[lgt]
+                i = 0
+                while i in indices:
+                    i += 1
 
-                    node_filter = pm.PyNode("%s.message" % filtr)
-                    node_lgt = pm.PyNode("%s.aiFilters[%s]" % (lgt, i))
-                    node_filter >> node_lgt
+                cmds.connectAttr("%s.message" % filtr.name(), "%s.aiFilters[%d]" % (lgt.name(), i))
+                indices.add(i)
+                inputs.add(filtr)
 
         filter_name = [node.name() for node in filter_selected]
         _logger.info("filter : %s " % filter_name)
         return filter_selected
 
-    @_wrapperUndoChunck
-    @_wrapperSelected
+    @_wrapperUndoSelected
+    @_wrapperSuspendRefresh
     def displayRadius(self):
         """ Create 'aiRadius' display from lights selected. """
-        save_selected = pm.selected()
         # Get lights
         lights = self._onlyLightsFromSelection()
         if not lights:
             return None
 
+        # Collect lights to display and their names before editing the scene
+        plans = []
+        for light in lights:
+            attr_radius = "%s.aiRadius" % light
+            # reloop if aiRaius not exist
+            if not cmds.objExists(attr_radius):
+                continue
+
+            # Reloop if display alradeay exist
+            if cmds.listConnections(attr_radius, source=False, destination=True, type="transform"):
+                continue
+
+            light_name = light.name()
+            plans.append((
+                light,
+                attr_radius,
+                _LIGHT_NAME_RE.sub(r"\g<lightname>\g<under>displayRadius\g<left>", light_name),
+                _LIGHT_NAME_RE.sub(r"\g<lightname>\g<under>localSpaceRadius\g<left>", light_name)))
+
+        if not plans:
+            _logger.info("No 'aiRadius' display created")
+            self.__displayRadiusCSS()
+            return []
+
         # Create mtoa utils grp
         utils_grp = self._eitherCreateGetNode("grp", self.mtoa_utils_grp)
-        display_radius_grp = self._eitherCreateGetNode("grp", self.display_radius_grp)
-        pm.parent(display_radius_grp, utils_grp)
+        display_radius_grp = self._eitherCreateGetNode("grp", self.display_radius_grp, parent=utils_grp)
 
         # Create shader
-        if not pm.objExists("displayRadius_SHAD"):
+        if not cmds.objExists("displayRadius_SHAD"):
             shader = pm.shadingNode("lambert", n="displayRadius_SHAD", asShader=True)
             shading_group= pm.sets(renderable=True, n="displayRadius_SDEG", noSurfaceShader=True, empty=True)
             pm.connectAttr('%s.outColor' % shader, '%s.surfaceShader' % shading_group)
@@ -1053,135 +1255,63 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             shader = pm.PyNode("displayRadius_SHAD")
 
         # Process
-        pm.select(save_selected)
-        out = []
-        for light in lights:
-            attr_radius = "%s.aiRadius" % light
-            # reloop if aiRaius not exist
-            if not pm.objExists(attr_radius):
-                continue
-
-            # Reloop if display alradeay exist
-            if pm.PyNode(attr_radius).inputs(type="expression"):
-                continue
-
+        display_meshes = []
+        local_space_groups = []
+        for light, attr_radius, display_mesh_name, local_space_name in plans:
             # Create Display
-            display_mesh_name = re.sub(
-                r"^(?P<lightname>[A-Za-z0-9]+)(?P<under>[_])(?P<utility>[a-zA-Z]*)(?P<left>[A-Za-z0-9_]+)$",
-                r"\g<lightname>\g<under>displayRadius\g<left>",
-                light.name())
-
-            display_mesh = pm.polySphere(n=display_mesh_name, subdivisionsAxis=36, subdivisionsHeight=36)[0]
-
-            # assign shader
-            pm.select(display_mesh)
-            pm.hyperShade(assign=shader)
-
-            # set attr
-            display_mesh_shape = display_mesh.getShape()
-            display_mesh_shape.attr("castsShadows").set(0)
-            display_mesh_shape.attr("receiveShadows").set(0)
-            display_mesh_shape.attr("motionBlur").set(0)
-            display_mesh_shape.attr("primaryVisibility").set(0)
-            display_mesh_shape.attr("smoothShading").set(0)
-            display_mesh_shape.attr("visibleInReflections").set(0)
-            display_mesh_shape.attr("visibleInRefractions").set(0)
-            display_mesh_shape.attr("doubleSided").set(0)
-            display_mesh_shape.attr("aiOpaque").set(0)
-            display_mesh_shape.attr("aiVisibleInDiffuseReflection").set(0)
-            display_mesh_shape.attr("aiVisibleInSpecularReflection").set(0)
-            display_mesh_shape.attr("aiVisibleInDiffuseTransmission").set(0)
-            display_mesh_shape.attr("aiVisibleInSpecularTransmission").set(0)
-            display_mesh_shape.attr("aiSelfShadows").set(0)
-
-            # Rotate
-            display_mesh.rotateX.set(90)
-            pm.select(display_mesh)
-            pm.makeIdentity(apply=True, t=1, r=1, s=1, n=0, pn=1)
-            display_mesh.rotateOrder.set(2)
-
-            # Align mesh to light
-            pm.pointConstraint(light, display_mesh)
-            pm.pointConstraint(light, display_mesh, rm=True)
-            pm.orientConstraint(light, display_mesh)
-            pm.orientConstraint(light, display_mesh, rm=True)
+            display_mesh = pm.polySphere(n=display_mesh_name, subdivisionsAxis=36, subdivisionsHeight=36, constructionHistory=False)[0]
+            display_meshes.append(display_mesh)
 
-            # Create new local space
-            local_space_name = re.sub(
-                r"^(?P<lightname>[A-Za-z0-9]+)(?P<under>[_])(?P<utility>[a-zA-Z]*)(?P<left>[A-Za-z0-9_]+)$",
-                r"\g<lightname>\g<under>localSpaceRadius\g<left>",
-                light.name())
+            # Set no renderable, then align mesh to light
+            self._configureDisplayMesh(display_mesh, light)
 
+            # Create new local space
             local_space_group = pm.group(em=True, n=local_space_name)
             pm.matchTransform(local_space_group, display_mesh)
             pm.parent(display_mesh, local_space_group)
-            pm.parent(local_space_group, display_radius_grp)
+            local_space_groups.append(local_space_group)
 
             pm.pointConstraint(light, local_space_group)
             pm.orientConstraint(light, local_space_group)
 
-            local_space_group.translate.lock()
-            local_space_group.rotate.lock()
-            local_space_group.scale.lock()
-
-            # Constraint
-            radius_value = pm.getAttr(attr_radius)
-            display_mesh.scaleZ.set(radius_value)
-            pm.expression(n="%s_radiusScaleZ_displayRadius" % light.name() ,s="{MESH_NAME}.scaleZ = {LIGHT}".format(
-                LIGHT=attr_radius,
-                MESH_NAME=display_mesh.name()) )
-
-            pm.expression(n="%s_radiusScaleX_displayRadius" % light.name() ,s="{MESH_NAME}.scaleX = {LIGHT}".format(
-                LIGHT=attr_radius,
-                MESH_NAME=display_mesh.name()) )
-
-            pm.expression(n="%s_radiusScaleY_displayRadius" % light.name() ,s="{MESH_NAME}.scaleY = {LIGHT}".format(
-                LIGHT=attr_radius,
-                MESH_NAME=display_mesh.name()) )
+            # Constraint, radius drives scale directly without expression
+            display_mesh_name = display_mesh.name()
+            for axis in ["X", "Y", "Z"]:
+                cmds.connectAttr(attr_radius, "%s.scale%s" % (display_mesh_name, axis), force=True)
 
             # lock mesh attribute dont needed
-            pm.select(display_mesh)
-            pm.transformLimits(esz=(True, False), sz=(0, 999999))
-            display_mesh.rotate.lock()
-            display_mesh.translate.lock()
-            display_mesh.scaleX.lock()
-            display_mesh.scaleY.lock()
+            cmds.transformLimits(display_mesh_name, enableScaleZ=(True, False), scaleZ=(0, 999999))
+            self._lockAttributes(display_mesh, ["rotate", "translate", "scaleX", "scaleY"])
 
             display_mesh.overrideEnabled.set(1)
             display_mesh.overrideDisplayType.set(2)
 
-            out.append(light)
+        # Parent local spaces in one call, then lock them
+        pm.parent(local_space_groups, display_radius_grp)
+        for local_space_group in local_space_groups:
+            self._lockAttributes(local_space_group, ["translate", "rotate", "scale"])
 
-        if out:
-            _logger.info("Display Radius success" % ([lgt.name() for lgt in out]))
-        else:
-            _logger.info("No 'aiRadius' display created")
+        # Assign shader to all displays at once
+        self._assignShader(display_meshes, shader)
+
+        out = [plan[0] for plan in plans]
+        _logger.info("Display Radius success : %s", _LazyNames(out))
 
-        pm.select(save_selected)
         self.__displayRadiusCSS()
         return out
 
     @_wrapperUndoChunck
     def deleteDisplayRadius(self):
         """ Delete all 'aiRadius' display. """
-        # Delete All expression
-        pm.delete([expr for expr in pm.ls(typ="expression") if "displayRadius" in expr.name()])
+        # Delete expressions driving the displays
+        self._deleteDisplayDrivers(self.display_radius_grp)
 
-        # Delete Folder
-        if pm.objExists(self.display_radius_grp):
-            pm.delete(self.display_radius_grp)
+        # Delete Folder and Shaders
+        self._deleteExistingNodes([self.display_radius_grp, "displayRadius_SHAD", "displayRadius_SDEG"])
 
         # Delete light Utils if empty
-        if pm.objExists(self.mtoa_utils_grp):
-            if not pm.PyNode(self.mtoa_utils_grp).getChildren():
-                pm.delete(self.mtoa_utils_grp)
-
-        # Delete Shaders
-        if pm.objExists("displayRadius_SHAD"):
-            pm.delete("displayRadius_SHAD")
-
-        if pm.objExists("displayRadius_SDEG"):
-            pm.delete("displayRadius_SDEG")
+        if cmds.objExists(self.mtoa_utils_grp) and not cmds.listRelatives(self.mtoa_utils_grp, children=True):
+            cmds.delete(self.mtoa_utils_grp)
 
         self.__displayRadiusCSS()
         _logger.info("'aiRadius' display successfully deleted.")
@@ -1189,44 +1319,37 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
     def __displayRadiusCSS(self):
         """ Stylize Display Radius button. """
-        if pm.objExists(self.display_radius_grp):
-            self.pushButton_displayRadius.setStyleSheet(self.css_btn_on)
+        if cmds.objExists(self.display_radius_grp):
+            self._setStyleSheet(self.pushButton_displayRadius, self.css_btn_on)
         else:
-            self.pushButton_displayRadius.setStyleSheet(self.css_btn_default)
+            self._setStyleSheet(self.pushButton_displayRadius, self.css_btn_default)
 
-    @_wrapperUndoChunck
-    @_wrapperSelected
+    @_wrapperUndoSelected
+    @_wrapperSuspendRefresh
     def displayBlocker(self):
         """ Create 'aiLightBlocker' display from lights selected. """
 
         # Get Blockers
-        blockers = []
-        for sel in pm.selected():
-            if pm.nodeType(sel.name()) == "transform":
-                if pm.nodeType(sel.getShape().name()) == "aiLightBlocker":
-                    blockers.append(sel)
-
-            else:
-                if pm.nodeType(sel.name()) == "aiLightBlocker":
-                    blockers.append(sel.getParent())
+        blockers = [pm.PyNode(shape).getParent() for shape, shape_type in self._selectedShapes() if shape_type == "aiLightBlocker"]
 
         # Abort if not blockers selected
         if not blockers:
             _logger.warning("No Blockers found")
             return None
 
-        # Rename all blockers
+        # Rename all blockers, skip ones already named
         for blocker in pm.ls(type="aiLightBlocker"):
-            blocker_name = blocker.name()
-            pm.rename(blocker.getParent(), "%s_C_001_AILB" % blocker_name)
+            blocker_transform = blocker.getParent()
+            blocker_name = "%s_C_001_AILB" % blocker.name()
+            if blocker_transform.nodeName() != blocker_name:
+                pm.rename(blocker_transform, blocker_name)
 
         # Create mtoa utils grp
         utils_grp = self._eitherCreateGetNode("grp", self.mtoa_utils_grp)
-        display_blocker_grp = self._eitherCreateGetNode("grp", self.display_blocker_grp)
-        pm.parent(display_blocker_grp, utils_grp)
+        display_blocker_grp = self._eitherCreateGetNode("grp", self.display_blocker_grp, parent=utils_grp)
 
         # Create shader
-        if not pm.objExists("displayBlocker_SHAD"):
+        if not cmds.objExists("displayBlocker_SHAD"):
             shader = pm.shadingNode("lambert", n="displayBlocker_SHAD", asShader=True)
             shading_group= pm.sets(renderable=True, n="displayBlocker_SDEG", noSurfaceShader=True, empty=True)
             pm.connectAttr('%s.outColor' % shader, '%s.surfaceShader' % shading_group)
@@ -1241,53 +1364,32 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         for blocker in blockers:
             #  query type of all blocker
             blocker_type = pm.getAttr("%s.geometryType" % blocker)
-            display_mesh_name = re.sub(
-                r"^(?P<lightname>[A-Za-z0-9]+)(?P<under>[_])(?P<utility>[a-zA-Z]*)(?P<left>[A-Za-z0-9_]+)$",
-                r"\g<lightname>\g<under>displayBlocker\g<left>",
-                blocker.name())
+            display_mesh_name = _LIGHT_NAME_RE.sub(r"\g<lightname>\g<under>displayBlocker\g<left>", blocker.name())
 
-            if pm.objExists(display_mesh_name):
+            if cmds.objExists(display_mesh_name):
                 continue
 
             # create Mesh
             if blocker_type == 0 :
-                display_mesh = pm.polyCube(n=display_mesh_name)[0]
+                display_mesh = pm.polyCube(n=display_mesh_name, constructionHistory=False)[0]
 
             elif blocker_type == 1 :
-                display_mesh = pm.polySphere(r=0.5, sh=16, sa=16, n=display_mesh_name)[0]
+                display_mesh = pm.polySphere(r=0.5, sh=16, sa=16, n=display_mesh_name, constructionHistory=False)[0]
 
             elif blocker_type == 2 :
-                display_mesh = pm.polyCube( d=1, w=1, h=0.01, n=display_mesh_name)[0]
-                pm.setAttr ( "%s.rx" %pm.ls(sl=True)[0], 90 )
-                pm.makeIdentity ( pm.ls(sl=True)[0], apply=True, t=1, r=1, s=1, n=0, pn=1 )
+                display_mesh = pm.polyCube( d=1, w=1, h=0.01, n=display_mesh_name, constructionHistory=False)[0]
+                display_mesh.rotateX.set(90)
+                pm.makeIdentity(display_mesh, apply=True, t=1, r=1, s=1, n=0, pn=1)
 
             else :
-                display_mesh = pm.polyCylinder(h=1, r=0, sa=16, n=display_mesh_name)[0]
+                display_mesh = pm.polyCylinder(h=1, r=0, sa=16, n=display_mesh_name, constructionHistory=False)[0]
 
             # Match Pivot
             piv_x, piv_y, piv_z, _, _, _ = pm.xform(blocker, q=True, piv=True)
             pm.xform(display_mesh, piv=(piv_x, piv_y, piv_z))
 
-            # Assign shader
-            pm.select(display_mesh)
-            pm.hyperShade(assign=shader)
-
-            # set attr
-            display_mesh_shape = display_mesh.getShape()
-            display_mesh_shape.attr("castsShadows").set(0)
-            display_mesh_shape.attr("receiveShadows").set(0)
-            display_mesh_shape.attr("motionBlur").set(0)
-            display_mesh_shape.attr("primaryVisibility").set(0)
-            display_mesh_shape.attr("smoothShading").set(0)
-            display_mesh_shape.attr("visibleInReflections").set(0)
-            display_mesh_shape.attr("visibleInRefractions").set(0)
-            display_mesh_shape.attr("doubleSided").set(0)
-            display_mesh_shape.attr("aiOpaque").set(0)
-            display_mesh_shape.attr("aiVisibleInDiffuseReflection").set(0)
-            display_mesh_shape.attr("aiVisibleInSpecularReflection").set(0)
-            display_mesh_shape.attr("aiVisibleInDiffuseTransmission").set(0)
-            display_mesh_shape.attr("aiVisibleInSpecularTransmission").set(0)
-            display_mesh_shape.attr("aiSelfShadows").set(0)
+            # Set no renderable
+            self._configureDisplayMesh(display_mesh)
 
             pm.parent(display_mesh, display_blocker_grp)
 
@@ -1301,7 +1403,9 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             out.append(display_mesh)
 
         if out:
-            _logger.info("Display Light Blocker success" % ([lgt.name() for lgt in out]))
+            # Assign shader to all displays at once
+            self._assignShader(out, shader)
+            _logger.info("Display Light Blocker success : %s", _LazyNames(out))
         else:
             _logger.info("No 'aiLightBlocker' display created")
 
@@ -1310,24 +1414,12 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
     def deleteDisplayBlocker(self):
         """ Delete all 'aiLightBlocker' display. """
-        # Delete All expression
-        pm.delete([expr for expr in pm.ls(typ="expression") if "displayBlocker" in expr.name()])
-
-        # Delete Folder
-        if pm.objExists(self.display_blocker_grp):
-            pm.delete(self.display_blocker_grp)
+        # Delete Folder and Shaders
+        self._deleteExistingNodes([self.display_blocker_grp, "displayBlocker_SHAD", "displayBlocker_SDEG"])
 
         # Delete light Utils if empty
-        if pm.objExists(self.mtoa_utils_grp):
-            if not pm.PyNode(self.mtoa_utils_grp).getChildren():
-                pm.delete(self.mtoa_utils_grp)
-
-        # Delete Shaders
-        if pm.objExists("displayBlocker_SHAD"):
-            pm.delete("displayBlocker_SHAD")
-
-        if pm.objExists("displayBlocker_SDEG"):
-            pm.delete("displayBlocker_SDEG")
+        if cmds.objExists(self.mtoa_utils_grp) and not cmds.listRelatives(self.mtoa_utils_grp, children=True):
+            cmds.delete(self.mtoa_utils_grp)
 
         self.__displayBlockerCSS()
         _logger.info("'aiLightBlocker' display successfully deleted.")
@@ -1335,19 +1427,19 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
     def __displayBlockerCSS(self):
         """ Stylize Display Blocker button. """
-        if pm.objExists(self.display_blocker_grp):
-            self.pushButton_displayBlocker.setStyleSheet(self.css_btn_on)
+        if cmds.objExists(self.display_blocker_grp):
+            self._setStyleSheet(self.pushButton_displayBlocker, self.css_btn_on)
         else:
-            self.pushButton_displayBlocker.setStyleSheet(self.css_btn_default)
+            self._setStyleSheet(self.pushButton_displayBlocker, self.css_btn_default)
 
-    @_wrapperUndoChunck
+    @_wrapperUndoSelected
+    @_wrapperSuspendRefresh
     def displayDecay(self, decay_type):
         """ Create 'aiDecay' display from lights selected.
 
             Args:
                 decay_type(str): type of decay that you want to display. 'near' or 'far'.
         """
-        save_selected = pm.selected()
         # Init
         lights = self._onlyLightsFromSelection()
         if not lights:
@@ -1357,14 +1449,12 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         utils_grp = self._eitherCreateGetNode("grp", self.mtoa_utils_grp)
         display_decay_grp = None
         if decay_type == "near":
-            display_decay_grp = self._eitherCreateGetNode("grp", self.display_decay_near_grp)
+            display_decay_grp = self._eitherCreateGetNode("grp", self.display_decay_near_grp, parent=utils_grp)
         elif decay_type == "far":
-            display_decay_grp = self._eitherCreateGetNode("grp", self.display_decay_far_grp)
-
-        pm.parent(display_decay_grp, utils_grp)
+            display_decay_grp = self._eitherCreateGetNode("grp", self.display_decay_far_grp, parent=utils_grp)
 
         # Create shader
-        if not pm.objExists("displayDecayStart_SHAD"):
+        if not cmds.objExists("displayDecayStart_SHAD"):
             shader_start = pm.shadingNode("lambert", n="displayDecayStart_SHAD", asShader=True)
             shading_group_start= pm.sets(renderable=True, n="displayDecayStart_SDEG", noSurfaceShader=True, empty=True)
             pm.connectAttr('%s.outColor' % shader_start, '%s.surfaceShader' % shading_group_start)
@@ -1374,7 +1464,7 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         else:
             shader_start = pm.PyNode("displayDecayStart_SHAD")
 
-        if not pm.objExists("displayDecayEnd_SHAD"):
+        if not cmds.objExists("displayDecayEnd_SHAD"):
             shader_end = pm.shadingNode("lambert", n="displayDecayEnd_SHAD", asShader=True)
             shading_group_end= pm.sets(renderable=True, n="displayDecayEnd_SDEG", noSurfaceShader=True, empty=True)
             pm.connectAttr('%s.outColor' % shader_end, '%s.surfaceShader' % shading_group_end)
@@ -1385,77 +1475,51 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             shader_end = pm.PyNode("displayDecayEnd_SHAD")
 
         # Process
-        pm.select(save_selected)
         out = []
+        display_meshes = {"Start" : [], "End" : []}
+        use_decay = "use%sAtten" % decay_type.capitalize()
         for light in lights:
-            decay = light.getShape().inputs(type="aiLightDecay")
+            # Resolve shape and type once per light
+            light_shape = light.getShape().longName()
+            light_type = cmds.nodeType(light_shape)
+            decay = cmds.listConnections(light_shape, source=True, destination=False, type="aiLightDecay")
+
+            light_name = light.name()
 
             # stop loop if decay doesn't exist
             if not decay:
-                self.log.warning("No decay connected to %s" % light.name())
+                _logger.warning("No decay connected to %s" % light_name)
                 continue
 
             # Get only one decay
-            decay = decay[0]
+            decay_name = decay[0]
 
             # Reloop if decay already exist
-            if pm.PyNode("%s.%sEnd" % (decay, decay_type)).inputs(type="expression"):
+            if cmds.listConnections("%s.%sEnd" % (decay_name, decay_type), source=True, destination=False):
                 continue
 
             # Process
             for startEnd in ["Start", "End"]:
                 attr_decay_name = decay_type + startEnd
-                attr_decay_value = decay.attr(attr_decay_name).get()
+                attr_decay_value = cmds.getAttr("%s.%s" % (decay_name, attr_decay_name))
                 # Create Display Mesh
-                display_mesh_name = re.sub(
-                    r"^(?P<lightname>[A-Za-z0-9]+)(?P<under>[_])(?P<utility>[a-zA-Z]*)(?P<left>[A-Za-z0-9_]+)$",
-                    r"\g<lightname>\g<under>display{}Decay\g<left>".format(startEnd),
-                    light.name())
-
-                if pm.nodeType(light.getShape().name()) == "spotLight":
-                    display_mesh = pm.polyCylinder(sa=32, sc=0, height=0.01, radius=5, n=display_mesh_name)[0]
-
-                elif pm.nodeType(light.getShape().name()) == "pointLight":
-                    display_mesh = pm.polySphere(n=display_mesh_name, subdivisionsAxis=36, subdivisionsHeight=36)[0]
-
-                # Assign Shader
-                pm.select (display_mesh)
-                pm.hyperShade(assign="displayDecay%s_SHAD" % startEnd)
-
-                # Set no renderable
-                display_mesh_shape = display_mesh.getShape()
-                display_mesh_shape.attr("castsShadows").set(0)
-                display_mesh_shape.attr("receiveShadows").set(0)
-                display_mesh_shape.attr("motionBlur").set(0)
-                display_mesh_shape.attr("primaryVisibility").set(0)
-                display_mesh_shape.attr("smoothShading").set(0)
-                display_mesh_shape.attr("visibleInReflections").set(0)
-                display_mesh_shape.attr("visibleInRefractions").set(0)
-                display_mesh_shape.attr("doubleSided").set(0)
-                display_mesh_shape.attr("aiOpaque").set(0)
-                display_mesh_shape.attr("aiVisibleInDiffuseReflection").set(0)
-                display_mesh_shape.attr("aiVisibleInSpecularReflection").set(0)
-                display_mesh_shape.attr("aiVisibleInDiffuseTransmission").set(0)
-                display_mesh_shape.attr("aiVisibleInSpecularTransmission").set(0)
-                display_mesh_shape.attr("aiSelfShadows").set(0)
-
-                # Rotate
-                display_mesh.rotateX.set(90)
-                pm.select(display_mesh)
-                pm.makeIdentity(apply=True, t=1, r=1, s=1, n=0, pn=1)
-                display_mesh.rotateOrder.set(2)
+                display_mesh_name = _LIGHT_NAME_RE.sub(r"\g<lightname>\g<under>display{}Decay\g<left>".format(startEnd), light_name)
+
+                # Point lights decay in all directions, others along -Z
+                is_point = light_type == "pointLight"
+                if is_point:
+                    display_mesh = pm.polySphere(n=display_mesh_name, subdivisionsAxis=36, subdivisionsHeight=36, constructionHistory=False)[0]
+                else:
+                    display_mesh = pm.polyCylinder(sa=32, sc=0, height=0.01, radius=5, n=display_mesh_name, constructionHistory=False)[0]
+
+                display_meshes[startEnd].append(display_mesh)
+                display_mesh_name = display_mesh.name()
 
-                # Align mesh to light
-                pm.pointConstraint(light, display_mesh)
-                pm.pointConstraint(light, display_mesh, rm=True)
-                pm.orientConstraint(light, display_mesh)
-                pm.orientConstraint(light, display_mesh, rm=True)
+                # Set no renderable, then align mesh to light
+                self._configureDisplayMesh(display_mesh, light)
 
                 # Create new local space
-                local_space_name = re.sub(
-                    r"^(?P<lightname>[A-Za-z0-9]+)(?P<under>[_])(?P<utility>[a-zA-Z]*)(?P<left>[A-Za-z0-9_]+)$",
-                    r"\g<lightname>\g<under>localSpace{}Decay\g<left>".format(startEnd),
-                    light.name())
+                local_space_name = _LIGHT_NAME_RE.sub(r"\g<lightname>\g<under>localSpace{}Decay\g<left>".format(startEnd), light_name)
 
                 local_space_group = pm.group(em=True, n=local_space_name)
                 pm.matchTransform(local_space_group, display_mesh)
@@ -1465,77 +1529,41 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
                 pm.pointConstraint(light, local_space_group)
                 pm.orientConstraint(light, local_space_group)
 
-                local_space_group.translate.lock()
-                local_space_group.rotate.lock()
-                local_space_group.scale.lock()
-                # Get angle
+                self._lockAttributes(local_space_group, ["translate", "rotate", "scale"])
 
                 # Constraint
-                if pm.nodeType(light.getShape().name()) == "spotLight":
-                    cone_angle = light.coneAngle.get()
-                    display_mesh.translateZ.set(-(attr_decay_value))
-                    pm.expression(n="%s_%s_decayTranslateZ_displayDecay" % (light.name(), startEnd) ,s="{DECAY_NAME}.{DECAY_TYPE} = -({MESH_NAME}.translateZ)".format(
-                        DECAY_NAME=decay.name(),
-                        DECAY_TYPE=attr_decay_name,
-                        MESH_NAME=display_mesh.name())
-                    )
-                    # lock attribute of mesh dont needed
-                    pm.select(display_mesh)
-                    pm.transformLimits(etz=(False, True), tz=(-10000, 0))
-                    display_mesh.rotate.lock()
-                    #display_mesh.scale.lock()
-                    display_mesh.translateX.lock()
-                    display_mesh.translateY.lock()
-
-                elif pm.nodeType(light.getShape().name()) == "pointLight":
-                    display_mesh.scaleZ.set(attr_decay_value)
-                    pm.expression(n="%s_%s_decayScaleZ_displayDecay" % (light.name(), startEnd) ,s="{DECAY_NAME}.{DECAY_TYPE} = ({MESH_NAME}.scaleZ)".format(
-                        DECAY_NAME=decay.name(),
-                        DECAY_TYPE=attr_decay_name,
-                        MESH_NAME=display_mesh.name())
-                    )
-                    pm.expression(n="%s_%s_decayScaleX_displayDecay" % (light.name(), startEnd) ,s="{MESH_NAME}.scaleX = ({MESH_NAME}.scaleZ)".format(
-                        MESH_NAME=display_mesh.name())
-                    )
-                    pm.expression(n="%s_%s_decayScaleY_displayDecay" % (light.name(), startEnd) ,s="{MESH_NAME}.scaleY = ({MESH_NAME}.scaleZ)".format(
-                        MESH_NAME=display_mesh.name())
-                    )
+                if is_point:
+                    cmds.setAttr("%s.scaleZ" % display_mesh_name, attr_decay_value)
+                    # Scale Z drives decay and uniform scale directly
+                    scale_z = "%s.scaleZ" % display_mesh_name
+                    cmds.connectAttr(scale_z, "%s.%s" % (decay_name, attr_decay_name), force=True)
+                    cmds.connectAttr(scale_z, "%s.scaleX" % display_mesh_name, force=True)
+                    cmds.connectAttr(scale_z, "%s.scaleY" % display_mesh_name, force=True)
                     # lock attribute of mesh dont needed
-                    pm.select(display_mesh)
-                    pm.transformLimits(esz=(True, False), sz=(0, 999999))
-                    display_mesh.rotate.lock()
-                    display_mesh.translate.lock()
-                    display_mesh.scaleX.lock()
-                    display_mesh.scaleY.lock()
+                    cmds.transformLimits(display_mesh_name, enableScaleZ=(True, False), scaleZ=(0, 999999))
+                    self._lockAttributes(display_mesh, ["rotate", "translate", "scaleX", "scaleY"])
 
                 else:
-                    display_mesh.translateZ.set(-(attr_decay_value))
-                    pm.expression(n="%s_%s_decayTranslateZ_displayDecay" % (light.name(), startEnd) ,s="{DECAY_NAME}.{DECAY_TYPE} = -({MESH_NAME}.translateZ)".format(
-                        DECAY_NAME=decay.name(),
-                        DECAY_TYPE=attr_decay_name,
-                        MESH_NAME=display_mesh.name())
-                    )
-                    pm.expression(n="%s_%s_decayTranslateZ_displayDecay" % (light.name(), startEnd) ,s="{DECAY_NAME}.{DECAY_TYPE} = -({MESH_NAME}.translateZ)".format(
-                        DECAY_NAME=decay.name(),
-                        DECAY_TYPE=attr_decay_name,
-                        MESH_NAME=display_mesh.name())
-                    )
+                    cmds.setAttr("%s.translateZ" % display_mesh_name, -attr_decay_value)
+                    self._connectNegated(
+                        "%s.translateZ" % display_mesh_name,
+                        "%s.%s" % (decay_name, attr_decay_name),
+                        "%s_%s_decayTranslateZ_displayDecay" % (light_name, startEnd))
                     # lock attribute of mesh dont needed
-                    pm.select(display_mesh)
-                    pm.transformLimits(etz=(False, True), tz=(-10000, 0))
-                    display_mesh.rotate.lock()
-                    #display_mesh.scale.lock()
-                    display_mesh.translateX.lock()
-                    display_mesh.translateY.lock()
-
+                    cmds.transformLimits(display_mesh_name, enableTranslationZ=(False, True), translationZ=(-10000, 0))
+                    self._lockAttributes(display_mesh, ["rotate", "translateX", "translateY"])
 
             # Set Decay ON
-            use_decay = "use%sAtten" % decay_type.capitalize()
-            decay.attr(use_decay).set(1)
+            cmds.setAttr("%s.%s" % (decay_name, use_decay), 1)
             out.append(light)
 
+        # Assign shaders to all displays at once
+        for startEnd, meshes in display_meshes.items():
+            if meshes:
+                self._assignShader(meshes, "displayDecay%s_SHAD" % startEnd)
+
         if out:
-            _logger.info("Display Decay success" % ([lgt.name() for lgt in out]))
+            _logger.info("Display Decay success : %s", _LazyNames(out))
         else:
             _logger.info("No 'aiDecay' display created")
 
@@ -1544,34 +1572,23 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
     def deleteDisplayDecay(self):
         """ Delete all 'aiDecay' display. """
-        # Delete All expression
-        pm.delete([expr for expr in pm.ls(typ="expression") if "displayDecay" in expr.name()])
-
-        # Delete Folder
-        if pm.objExists(self.display_decay_far_grp):
-            pm.delete(self.display_decay_far_grp)
-
-        # Delete Folder
-        if pm.objExists(self.display_decay_near_grp):
-            pm.delete(self.display_decay_near_grp)
+        # Delete expressions driving the displays
+        self._deleteDisplayDrivers(self.display_decay_far_grp)
+        self._deleteDisplayDrivers(self.display_decay_near_grp)
+
+        # Delete Folders and Shaders
+        self._deleteExistingNodes([
+            self.display_decay_far_grp,
+            self.display_decay_near_grp,
+            "displayDecayStart_SHAD",
+            "displayDecayEnd_SHAD",
+            "displayDecayStart_SDEG",
+            "displayDecayEnd_SDEG",
+        ])
 
         # Delete light Utils if empty
-        if pm.objExists(self.mtoa_utils_grp):
-            if not pm.PyNode(self.mtoa_utils_grp).getChildren():
-                pm.delete(self.mtoa_utils_grp)
-
-        # Delete Shaders
-        if pm.objExists("displayDecayStart_SHAD"):
-            pm.delete("displayDecayStart_SHAD")
-
-        if pm.objExists("displayDecayEnd_SHAD"):
-            pm.delete("displayDecayEnd_SHAD")
-
-        if pm.objExists("startDisplayDecay_SDEG"):
-            pm.delete("startDisplayDecay_SDEG")
-
-        if pm.objExists("endDisplayDecay_SDEG"):
-            pm.delete("endDisplayDecay_SDEG")
+        if cmds.objExists(self.mtoa_utils_grp) and not cmds.listRelatives(self.mtoa_utils_grp, children=True):
+            cmds.delete(self.mtoa_utils_grp)
 
         self.__displayDecayCSS()
         _logger.info("'aiDecay' display successfully deleted.")
@@ -1579,25 +1596,25 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
 
     def __displayDecayCSS(self):
         """ Stylize Display Decay button. """
-        if pm.objExists(self.display_decay_near_grp):
-            self.pushButton_displayNearDecay.setStyleSheet(self.css_btn_on)
+        if cmds.objExists(self.display_decay_near_grp):
+            self._setStyleSheet(self.pushButton_displayNearDecay, self.css_btn_on)
         else:
-            self.pushButton_displayNearDecay.setStyleSheet(self.css_btn_default)
+            self._setStyleSheet(self.pushButton_displayNearDecay, self.css_btn_default)
 
-        if pm.objExists(self.display_decay_far_grp):
-            self.pushButton_displayFarDecay.setStyleSheet(self.css_btn_on)
+        if cmds.objExists(self.display_decay_far_grp):
+            self._setStyleSheet(self.pushButton_displayFarDecay, self.css_btn_on)
         else:
-            self.pushButton_displayFarDecay.setStyleSheet(self.css_btn_default)
+            self._setStyleSheet(self.pushButton_displayFarDecay, self.css_btn_default)
 
     def advancedSelection(self):
         """ Advanced selection. """
         # Get infos
-        name_ = str(self.lineEdit_advancedSelection_name.text())
-        type_ = str(self.lineEdit_advancedSelection_type.text())
+        name_ = str(self.lineEdit_advancedSelection_name.text()).strip()
+        type_ = str(self.lineEdit_advancedSelection_type.text()).strip()
 
         # Shift string to list
-        names_ = [n for n in re.split(r",([ ]?)+", name_) if n]
-        types_ = [n for n in re.split(r",([ ]?)+", type_) if n]
+        names_ = [n for n in _SPLIT_RE.split(name_) if n]
+        types_ = [n for n in _SPLIT_RE.split(type_) if n]
 
         if not names_ and not types_:
             _logger.warning("No 'name' and 'type' found.")
@@ -1607,37 +1624,42 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             _logger.warning("'Exclude mode' is disabled with 'root mode'")
             return None
 
-        # Make list
+        # Make list, compared by long names rather than PyNodes
         out_shapes = None
         if types_ and names_:
-            out_shapes = pm.ls(names_, typ=types_, dag=True)
+            out_shapes = cmds.ls(names_, typ=types_, dag=True, long=True)
 
         elif types_ and not names_:
-            out_shapes = pm.ls(typ=types_, dag=True)
+            out_shapes = cmds.ls(typ=types_, dag=True, long=True)
 
         elif names_ and not types_:
-            out_shapes = pm.ls(names_, dag=True)
+            out_shapes = cmds.ls(names_, dag=True, long=True)
 
         # If selected
         selected_children = []
         if self.radioButton_advancedSelection_selected.isChecked():
-            selected = pm.selected()
+            selected = cmds.ls(sl=True, long=True)
             if not selected:
                 _logger.warning("Nothing selected in scene")
                 return None
 
-            # Populate list
-            for sel_ in selected:
-                selected_children.extend([shape for shape in sel_.getChildren(ad=True, s=True) if pm.nodeType(shape.name()) != "srHookShape"])
+            # Populate set, hook shapes are filtered in one typed query
+            selected_children = cmds.listRelatives(selected, allDescendents=True, shapes=True, fullPath=True) or []
+            children_set = set(selected_children)
+            if selected_children and cmds.nodeType("srHookShape", isTypeName=True):
+                children_set.difference_update(cmds.ls(selected_children, type="srHookShape", long=True))
 
             # Include/Exclude process
+            out_set = set(out_shapes)
             if self.radioButton_advancedSelection_exclude.isChecked():
-                out_shapes = list(set(selected_children).difference(out_shapes))
+                out_shapes = list(children_set - out_set)
+            elif out_set:
+                out_shapes = list(children_set & out_set)
             else:
-                out_shapes = list(set(selected_children).intersection(out_shapes))
+                out_shapes = []
 
         # Get transform from lists
-        out_transforms = [shape.getParent() for shape in out_shapes]
+        out_transforms = self._getParents(out_shapes)
 
         # Return if list is empty
         if not out_transforms:
@@ -1648,40 +1670,13 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         _logger.info("adavanced selection : %s" % return_name)
         pm.select(out_transforms)
 
+    @_wrapperUndoChunck
+    @_wrapperSuspendRefresh
     def colorOutlinerSelected(self, color_, enable=True):
         """ Colorize Item selected in outliner. """
         # PREPROCESS
-        selected = pm.selected()
-        set_color = None
-        if color_ == "red":
-            set_color = (1.000, 0.500, 0.500)
-
-        elif color_ == "orange":
-            set_color = (0.900, 0.700, 0.400)
-
-        elif color_ == "yellow":
-            set_color = (1.000, 1.000, 0.500)
-
-        elif color_ == "green":
-            set_color = (0.600, 1.000, 0.400)
-
-        elif color_ == "turquoise":
-            set_color = (0.300, 1.000, 0.700)
-
-        elif color_ == "cyan":
-            set_color = (0.500, 1.000, 1.000)
-
-        elif color_ == "blue":
-            set_color = (0.300, 0.700, 1.000)
-
-        elif color_ == "purple":
-            set_color = (0.600, 0.400, 1.000)
-
-        elif color_ == "magenta":
-            set_color = (1.000, 0.500, 1.000)
-
-        else:
-            set_color = (0.000, 0.000, 0.000)
+        selected = cmds.ls(sl=True, long=True)
+        set_color = _OUTLINER_COLORS.get(color_, (0.000, 0.000, 0.000))
 
         # Return if selection is empty
         if not selected:
@@ -1691,41 +1686,37 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         # Remove Color outliner
         if not enable:
             for node in selected:
-                node.useOutlinerColor.set(False)
+                cmds.setAttr("%s.useOutlinerColor" % node, False)
             _logger.info("Color Outliner disabled")
             pm.mel.eval("AEdagNodeCommonRefreshOutliners()")
             return
 
         # Set Color outliner
         for node in selected:
-            node.useOutlinerColor.set(True)
-            node.outlinerColor.set(set_color)
+            cmds.setAttr("%s.useOutlinerColor" % node, True)
+            cmds.setAttr("%s.outlinerColor" % node, *set_color, type="double3")
 
         pm.mel.eval("AEdagNodeCommonRefreshOutliners()")
         _logger.info("Color Outliner success")
 
     def selectChildren(self):
         """ Select All tranforms children from selection """
-        include = self.lgt_types + ["mesh"]
-        selected = pm.selected()
+        selection = cmds.ls(sl=True, long=True, showType=True)
 
         # Return if selection is empty
-        if not selected:
+        if not selection:
             _logger.warning("Nothing selected")
             return None
 
-        # Get shapes
-        out_shapes = []
-        for node in selected:
-            out_shapes.extend([node for node in node.getChildren(ad=True, s=True)])
-            if pm.nodeType(node.name()) in include:
-                out_shapes.append(node)
+        # Get shapes of whole selection in one query, plus selected shapes
+        out_shapes = cmds.listRelatives(selection[::2], allDescendents=True, shapes=True, fullPath=True) or []
+        out_shapes.extend([node for node, node_type in zip(selection[::2], selection[1::2]) if node_type in self.select_children_types])
 
         # Get transform node
-        out_transforms = [shape.getParent() for shape in out_shapes]
+        out_transforms = self._getParents(out_shapes)
 
         pm.select(out_transforms)
-        _logger.info("%s selected" % [node.name() for node in out_transforms])
+        _logger.info("%s selected", _LazyNames(out_transforms))
         return out_transforms
 
     def getUnusedLightFilters(self, filter_name):
@@ -1748,12 +1739,18 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             _logger.warning("No %s found" % filter_name)
             return None
 
+        # Get outputs of all filters in one query, listed as [filter plug, output node, ...] pairs
+        connections = cmds.listConnections([lightfilter.name() for lightfilter in all_lightfilters], source=False, destination=True, connections=True) or []
+        used_filters = set()
+        for filter_plug, output in zip(connections[::2], connections[1::2]):
+            if "defaultRenderUtilityList" not in output:
+                used_filters.add(filter_plug.split(".", 1)[0])
+
         # Get disconnected filters
         disconnected_filters = []
         connected_filters = []
         for lightfilter in all_lightfilters:
-            outputs = [output for output in lightfilter.outputs() if "defaultRenderUtilityList" not in output.name()]
-            if not outputs:
+            if lightfilter.name() not in used_filters:
                 disconnected_filters.append(lightfilter)
             else:
                 connected_filters.append(lightfilter)
@@ -1762,15 +1759,15 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         null_filters = []
         if filter_name == "aiLightBlocker":
             for blocker in connected_filters:
-                if not blocker.density.get():
+                if not cmds.getAttr("%s.density" % blocker.name()):
                     null_filters.append(blocker)
 
         if filter_name == "aiLightDecay":
             for decay in connected_filters:
-                if not decay.useNearAtten.get() and not decay.useFarAtten.get():
+                decay_name = decay.name()
+                if not cmds.getAttr("%s.useNearAtten" % decay_name) and not cmds.getAttr("%s.useFarAtten" % decay_name):
                     null_filters.append(decay)
 
-
         # Return if all filters is used
         if not disconnected_filters and not null_filters:
             _logger.info("All filters is used.")
@@ -1780,11 +1777,13 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         filters = {"disconnected" : disconnected_filters, "null" : null_filters, "type" : filter_name}
         createUnusedFiltersWindow(filters, self.deleteSafelyLightFilter)
 
+    @_wrapperUndoChunck
+    @_wrapperSuspendRefresh
     def deleteSafelyLightFilter(self, filters):
         """ Delete safely unused Arnold light filter.
 
             Args:
-                filters(dict): Filter type and List of disconnected/null filters that you want to delete.
+                filters(dict): Filter type and List of disconnected/null filters names that you want to delete.
         """
         # Check input attributes
         if filters["type"] not in ["aiLightDecay", "aiLightBlocker"]:
@@ -1795,85 +1794,87 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             _logger.warning("No light filters found.")
             return None
 
+        # Work on names, the unused filters window only gives back item datas strings
+        null_filters = [str(lightfilter) for lightfilter in filters["null"] if cmds.objExists(str(lightfilter))]
+        disconnected_filters = [str(lightfilter) for lightfilter in filters["disconnected"] if cmds.objExists(str(lightfilter))]
+
         # Disconnect null filters from light
-        for lightfilter in filters["null"]:
+        for filter_name in null_filters:
+
             # Get connected lights
-            lights = pm.connectionInfo("%s.message" % lightfilter, dfs=True)
-            lights = [connection for connection in lights if "aiFilters" in connection]
+            plugs = cmds.listConnections("%s.message" % filter_name, source=False, destination=True, plugs=True) or []
+            light_nodes = set(plug.split(".", 1)[0] for plug in plugs if ".aiFilters[" in plug)
 
-            for light in lights :
-                light_node = pm.PyNode(light.split(".")[0])
-                num_filter = len( pm.PyNode("%s.aiFilters" % light_node).inputs() )
-                index = int( re.findall(r"\[[0-9]+\]", light)[0].strip("[]") )
+            for light_node in light_nodes:
+                # Get all filters of light at once, sorted by index
+                connections = cmds.listConnections("%s.aiFilters" % light_node, source=True, destination=False, connections=True, plugs=True) or []
+                slots = sorted((int(_AIFILTER_IDX_RE.search(filter_plug).group(1)), source_plug) for filter_plug, source_plug in zip(connections[::2], connections[1::2]))
 
-                i = 0
-                while (i < num_filter):
-                    if i == index:
-                        pm.PyNode("%s.message" % lightfilter) // pm.PyNode(pm.PyNode("%s.aiFilters[%s]" % (light_node, i)))
+                # Only filters from the first removed one have to move
+                removed = [pos for pos, (_, source_plug) in enumerate(slots) if source_plug.split(".", 1)[0] == filter_name]
+                if not removed:
+                    continue
 
-                    if i > index:
-                        other_filter = pm.connectionInfo("%s.aiFilters[%s]" % (light_node, i), sfd=True)
-                        other_filter = pm.PyNode(other_filter)
-                        other_filter // pm.PyNode("%s.aiFilters[%s]" % (light_node, i))
-                        other_filter >> pm.PyNode("%s.aiFilters[%s]" % (light_node, i - 1))
+                moved = slots[removed[0]:]
+                kept = [source_plug for _, source_plug in moved if source_plug.split(".", 1)[0] != filter_name]
 
-                    i += 1
+                for index, source_plug in moved:
+                    cmds.disconnectAttr(source_plug, "%s.aiFilters[%d]" % (light_node, index))
+
+                for (index, _), source_plug in zip(moved, kept):
+                    cmds.connectAttr(source_plug, "%s.aiFilters[%d]" % (light_node, index))
 
         # Delete unused and null filters
-        deleted_filters = filters["disconnected"] + filters["null"]
-        for lightfilter in deleted_filters:
-            if pm.objExists(lightfilter):
-                try:
-                    pm.delete(lightfilter.getParent())
-                except AttributeError :
-                    pm.delete(lightfilter)
+        deleted_filters = disconnected_filters + null_filters
+        to_delete = []
+        for filter_name in deleted_filters:
+            # Blockers are deleted with their transform, decays have no parent
+            parent = cmds.listRelatives(filter_name, parent=True, fullPath=True)
+            to_delete.append(parent[0] if parent else filter_name)
+
+        if to_delete:
+            cmds.delete(to_delete)
 
         _logger.info("Safely deleted {0} : {1}".format(filters["type"], deleted_filters))
         return deleted_filters
 
     def selectNotIlluminatingLights(self):
         """ Select not Illuminating lights """
-        not_illuminating = []
-        for light in self._getAllLights():
-            if not pm.lightlink(light=light):
-                not_illuminating.append(light)
+        # Query with names, linked objects are not needed as PyNodes
+        not_illuminating = [light for light in self._getAllLights() if not cmds.lightlink(query=True, light=light.name())]
 
         if not not_illuminating:
             _logger.info("all Lights is linked")
             return
 
         pm.select(not_illuminating)
-        _logger.info("%s illuminate nothing" % [lgt.name() for lgt in not_illuminating])
+        _logger.info("%s illuminate nothing", _LazyNames(not_illuminating))
 
     def lightOptimizer__selectLightsFromList(self):
         """ Select lights from 'lightOptimizer' item selected. """
-        # Get lightname from list
-        lights = []
-        for item in self.listWidget_lightOptimizer.selectedItems():
-            datas = item.data(CUSTOM_INDEX)
-            lights.append(pm.PyNode(datas["lightname"]))
-
-        # Get transform
-        lights_transform = [node.getParent() for node in lights]
-        pm.select(lights_transform)
+        # Get transforms from item datas
+        lights_transform = [item.data(CUSTOM_INDEX)["transform"] for item in self.listWidget_lightOptimizer.selectedItems()]
+        if lights_transform:
+            cmds.select(lights_transform, replace=True)
+        else:
+            cmds.select(clear=True)
 
-        return_lgts_name = [lgts.name() for lgts in lights_transform]
-        _logger.info("Select : %s" % return_lgts_name)
+        _logger.info("Select : %s", lights_transform)
 
+    @_wrapperUndoChunck
     def lightOptimizer__setMultiplesValues(self):
         """ Set multiples values from 'lightOptimizer' item selected. """
         value = self.doubleSpinBox_lightOptimizer_value.value()
-        lights = []
+        plugs = []
 
         for item in self.listWidget_lightOptimizer.selectedItems():
             datas = item.data(CUSTOM_INDEX)
-            light_node = pm.PyNode("%s.%s" % (datas["lightname"], datas["attribute"]))
-            lights.append(light_node)
+            plugs.append("%s.%s" % (datas["lightname"], datas["attribute"]))
 
-        for light in lights:
-            light.set(value)
+        for plug in plugs:
+            cmds.setAttr(plug, value)
 
-        _logger.info("lights : %s, value : %s" % (lights, value))
+        _logger.info("lights : %s, value : %s", plugs, value)
 
     def _lightOptimizer__sortingLights(self, attr_):
         """ Sort lights attributes values.
@@ -1895,48 +1896,28 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         if all_lights is None:
             return None
 
+        # Last slider step also keeps values above it
+        overflow = _OPTIMIZER_OVERFLOW.get(attr_) == max_value
+
         out = []
         for light in all_lights:
-            value = pm.getAttr("%s.%s" % (light, attr_))
-
-            if (value >= min_value) and (value <= max_value):
-                light_data = {
-                    "lightname" : light.name(),
-                    "transform" : light.getParent().name(),
-                    "type" : pm.nodeType(light.name()),
-                    "attribute" : attr_,
-                    "value" : value }
-
-                out.append(light_data)
-
-            elif (max_value == 11) and (value >= 10) and (attr_ in ["aiSamples", "aiVolumeSamples"]):
-                light_data = {
-                    "lightname" : light.name(),
-                    "transform" : light.getParent().name(),
-                    "type" : pm.nodeType(light.name()),
-                    "attribute" : attr_,
-                    "value" : value }
-
-            elif (max_value == 101) and (value >= 100) and (attr_ == "aiRadius"):
-                light_data = {
-                    "lightname" : light.name(),
-                    "transform" : light.getParent().name(),
-                    "type" : pm.nodeType(light.name()),
-                    "attribute" : attr_,
-                    "value" : value }
-
-            elif (max_value == 21) and (value >= 20) and (attr_ in ["aiExposure", "intensity"]):
-                light_data = {
-                    "lightname" : light.name(),
-                    "transform" : light.getParent().name(),
-                    "type" : pm.nodeType(light.name()),
-                    "attribute" : attr_,
-                    "value" : value }
-
-                out.append(light_data)
-
-        reordered_list = reversed(sorted(out, key=lambda k: k['value']))
-        return reordered_list
+            light_name = light.name()
+            value = cmds.getAttr("%s.%s" % (light_name, attr_))
+
+            if not ((min_value <= value <= max_value) or (overflow and value >= max_value - 1)):
+                continue
+
+            light_data = {
+                "lightname" : light_name,
+                "transform" : light.getParent().name(),
+                "type" : cmds.nodeType(light_name),
+                "attribute" : attr_,
+                "value" : value }
+
+            out.append(light_data)
+
+        out.sort(key=lambda k: k["value"], reverse=True)
+        return out
 
     def __lightOptimizer__populateGrid(self):
         """ Populate 'lightOptimizer' grid from light attributes. """
@@ -1948,18 +1929,53 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         if lights is None:
             return None
 
-        for item in lights:
-            item_ui = JMLightOptimizerItem(item, self.__lightOptimizer__populateGrid)
+        if not lights:
+            return lights
+
+        # Rows share the size of the first widget, others widgets are built when visible
+        list_widget = self.listWidget_lightOptimizer
+        list_widget.setUpdatesEnabled(False)
+        if self._optimizer_size_hint is None:
+            # Measured once per window from a throwaway row widget
+            dummy = JMLightOptimizerItem(lights[0], self._optimizer_timer.start)
+            self._optimizer_size_hint = dummy.sizeHint()
+            dummy.deleteLater()
 
+        for item in lights:
             list_widget_item = QtWidgets.QListWidgetItem()
-            list_widget_item.setSizeHint(item_ui.sizeHint())
+            list_widget_item.setSizeHint(self._optimizer_size_hint)
             list_widget_item.setData(CUSTOM_INDEX, item)
+            list_widget.addItem(list_widget_item)
 
-            self.listWidget_lightOptimizer.addItem(list_widget_item)
-            self.listWidget_lightOptimizer.setItemWidget(list_widget_item, item_ui)
-
+        # Lay new rows out now so visible rows can be measured
+        list_widget.setUpdatesEnabled(True)
+        list_widget.doItemsLayout()
+        self.__lightOptimizer__buildVisibleItems()
         return lights
 
+    def __lightOptimizer__buildVisibleItems(self, *args):
+        """ Build 'lightOptimizer' item widgets of visible rows, plus a few rows ahead. """
+        list_widget = self.listWidget_lightOptimizer
+        count = list_widget.count()
+        if not count:
+            return None
+
+        viewport = list_widget.viewport().rect()
+        first = list_widget.indexAt(viewport.topLeft()).row()
+        last = list_widget.indexAt(viewport.bottomLeft()).row()
+        first = max(first, 0)
+        if last < 0:
+            # No row under the bottom edge, build at most one viewport of rows
+            row_height = max(self._optimizer_size_hint.height(), 1) if self._optimizer_size_hint else 1
+            last = first + viewport.height() // row_height
+        last = min(last + 5, count - 1)
+
+        for row in range(first, last + 1):
+            list_widget_item = list_widget.item(row)
+            if list_widget.itemWidget(list_widget_item) is None:
+                item_ui = JMLightOptimizerItem(list_widget_item.data(CUSTOM_INDEX), self._optimizer_timer.start)
+                list_widget.setItemWidget(list_widget_item, item_ui)
+
     def __lightOptimizer__populateComboBox(self):
         """ Populate 'lightOptimizer' combo box attributes. """
         for attr in self.optimize_attrs:
@@ -2005,7 +2021,7 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         """ Connect 'lightOptimizer' UI if button is checked. """
         if pm.pluginInfo("mtoa", q=True, loaded=True):
             if self.pushButton_lightOptimizer_sync.isChecked():
-                self.pushButton_lightOptimizer_sync.setStyleSheet(self.default_stylesheet)
+                self._setStyleSheet(self.pushButton_lightOptimizer_sync, self.default_stylesheet)
                 self.pushButton_lightOptimizer_sync.setIcon(self.icon_sync_on)
 
                 self.comboBox_lightOptimizer_attributes.currentIndexChanged.connect(self.__lightOptimizer__populateGrid)
@@ -2016,7 +2032,7 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
                 self.__lightOptimizer__populateGrid()
 
             else:
-                    self.pushButton_lightOptimizer_sync.setStyleSheet(self.default_stylesheet)
+                    self._setStyleSheet(self.pushButton_lightOptimizer_sync, self.default_stylesheet)
                     self.pushButton_lightOptimizer_sync.setIcon(self.icon_sync_off)
 
                     try:
@@ -2042,9 +2058,10 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             Returns:
                 (list): All lights from scene
         """
-        lights = []
-        for lgt_type in self.lgt_types:
-            lights.extend(pm.ls(type=lgt_type))
+        if self._all_lights_cache is None:
+            self._all_lights_cache = pm.ls(type=self.lgt_types)
+
+        lights = list(self._all_lights_cache)
 
         # Return if list is empty
         if not lights:
@@ -2055,7 +2072,7 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         if not get_shapes:
             lights = [shape.getParent() for shape in lights]
 
-        _logger.debug("_getAllLights : %s" % lights)
+        _logger.debug("_getAllLights : %s", lights)
         return lights
 
     def _onlyLightsFromSelection(self, get_shapes=False, all_hierachy=False):
@@ -2068,26 +2085,31 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             Returns:
                 (list): Selected lights
         """
-        # Get either selection or selection + children
-        selection = []
-        if all_hierachy:
-            for node in pm.selected():
-                children = [nde for nde in node.getChildren(ad=True) if pm.nodeType(nde.name()) != "transform"]
-                selection.extend(children)
-        else:
-            selection.extend(pm.selected())
-
-        lights = []
-        for node in selection:
-            # Get shape
-            if pm.nodeType(node.name()) == "transform":
-                node = node.getShape()
-                if node is None:
-                    continue
-
-            # Check node type then append it to 'lights' list if is a light node
-            if pm.nodeType(node.name()) in self.lgt_types:
-                lights.append(node)
+        # Get either selection or selection + children, then let Maya filter light types
+        selection = cmds.ls(sl=True, long=True)
+        light_shapes = []
+        if selection and all_hierachy:
+            children = cmds.listRelatives(selection, allDescendents=True, fullPath=True)
+            if children:
+                light_shapes = cmds.ls(children, type=self.lgt_types, long=True)
+
+        elif selection:
+            candidates = selection + (cmds.listRelatives(selection, shapes=True, fullPath=True) or [])
+            found = cmds.ls(candidates, type=self.lgt_types, long=True)
+
+            # Keep selection order, a transform resolves to its first light shape
+            found_set = set(found)
+            parent_shape = {}
+            for shape in found:
+                parent_shape.setdefault(shape.rsplit("|", 1)[0], shape)
+
+            for node in selection:
+                if node in found_set:
+                    light_shapes.append(node)
+                elif node in parent_shape:
+                    light_shapes.append(parent_shape[node])
+
+        lights = [pm.PyNode(shape) for shape in light_shapes]
 
         # Return if list is empty
         if not lights:
@@ -2098,21 +2120,102 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
         if not get_shapes:
             lights = [shape.getParent() for shape in lights]
 
-        _logger.debug("_onlyLightsFromSelection : %s" % lights)
+        _logger.debug("_onlyLightsFromSelection : %s", lights)
         return lights
 
-    def _eitherCreateGetNode(self, node_type, node_name):
+    def _selectedShapes(self):
+        """ Get selected shapes and their type with bulk queries, a transform resolves to its first shape.
+
+            Returns:
+                (list): (shape, type) tuples in selection order.
+        """
+        selection = cmds.ls(sl=True, long=True, showType=True)
+        node_types = dict(zip(selection[::2], selection[1::2]))
+
+        # Get first shape of each selected transform
+        first_shapes = {}
+        transforms = [node for node in selection[::2] if node_types[node] == "transform"]
+        shapes = cmds.listRelatives(transforms, shapes=True, fullPath=True) if transforms else None
+        shapes = cmds.ls(shapes, long=True, showType=True) if shapes else []
+        for shape, shape_type in zip(shapes[::2], shapes[1::2]):
+            first_shapes.setdefault(shape.rsplit("|", 1)[0], (shape, shape_type))
+
+        out = []
+        for node in selection[::2]:
+            if node_types[node] != "transform":
+                out.append((node, node_types[node]))
+            elif node in first_shapes:
+                out.append(first_shapes[node])
+
+        return out
+
+    def _getParents(self, nodes):
+        """ Get parents of nodes in one query, without duplicates.
+
+            Args:
+                nodes (list): Nodes to get parent from.
+
+            Returns:
+                (list): Parents in nodes order.
+        """
+        parents = pm.listRelatives(nodes, parent=True, fullPath=True) if nodes else []
+        seen = set()
+        return [parent for parent in parents if not (parent in seen or seen.add(parent))]
+
+    def _getSetsMembers(self):
+        """ Get selection with object sets replaced by their members.
+
+            Returns:
+                (list): Selected nodes long names.
+        """
+        selected = cmds.ls(sl=True, long=True)
+        object_sets = cmds.ls(selected, type="objectSet") if selected else []
+        nodes = [node for node in selected if node not in object_sets]
+
+        # Flatten nested sets
+        while object_sets:
+            members = cmds.sets(object_sets.pop(), query=True) or []
+            nested_sets = cmds.ls(members, type="objectSet") if members else []
+            object_sets.extend(nested_sets)
+            nodes.extend([member for member in members if member not in nested_sets])
+
+        return cmds.ls(nodes, long=True) if nodes else []
+
+    def _splitLightsObjects(self, nodes):
+        """ Split nodes between lights and others objects, with bulk queries.
+
+            Args:
+                nodes (list): Nodes long names.
+
+            Returns:
+                (tuple): Lights and objects lists, in nodes order.
+        """
+        if not nodes:
+            return [], []
+
+        light_nodes = set(cmds.ls(nodes, type=self.lgt_types, long=True))
+        transforms = cmds.ls(nodes, type="transform", long=True)
+        light_shapes = cmds.listRelatives(transforms, shapes=True, type=self.lgt_types, fullPath=True) if transforms else None
+        if light_shapes:
+            light_nodes.update(cmds.listRelatives(light_shapes, parent=True, fullPath=True))
+
+        lights = [node for node in nodes if node in light_nodes]
+        objects = [node for node in nodes if node not in light_nodes]
+        return lights, objects
+
+    def _eitherCreateGetNode(self, node_type, node_name, parent=None):
         """ Either create or get existing node.
 
             Args:
                 node_type (str): Node type to either get or create.
                 node_name (str): Node name to either get or create.
+                parent (PyNode): Parent node, only reparented if not already its child.
 
             Returns:
                 (PyNode): Node either getted or created.
         """
         node = None
-        if pm.objExists(node_name):
+        if cmds.objExists(node_name):
             node = pm.PyNode(node_name)
         else:
             if node_type == "grp":
@@ -2120,8 +2223,149 @@ class JMLightToolkit(MayaQWidgetDockableMixin, QWidget, Ui_widget_root):
             else:
                 node = pm.createNode(node_type, n=node_name, ss=True)
 
+        if parent is not None and node.getParent() != parent:
+            pm.parent(node, parent)
+
         return node
 
+    def _createDisplayLayer(self, name, members, color, visibility=True):
+        """ Create display layer from members names.
+
+            Args:
+                name (str): Display layer name.
+                members (list): Nodes to add in layer.
+                color (int): Display layer color index.
+                visibility (bool): Display layer visibility.
+
+            Returns:
+                (str): Display layer created.
+        """
+        layer = cmds.createDisplayLayer(name=name, empty=True)
+        if members:
+            cmds.editDisplayLayerMembers(layer, members, noRecurse=True)
+
+        cmds.setAttr("%s.color" % layer, color)
+        cmds.setAttr("%s.visibility" % layer, visibility)
+        return layer
+
+    def _setStyleSheet(self, widget, css):
+        """ Apply stylesheet only if it changed, Qt re-polishes widget on each call.
+
+            Args:
+                widget (QWidget): Widget to stylize.
+                css (str): Stylesheet to apply.
+        """
+        if widget.styleSheet() != css:
+            widget.setStyleSheet(css)
+
+    def _configureDisplayMesh(self, display_mesh, light=None):
+        """ Make display mesh not renderable, then align it to light.
+
+            Args:
+                display_mesh (PyNode): Display mesh to configure.
+                light (PyNode): Light to align display mesh to. Not aligned if None.
+        """
+        display_mesh_shape = display_mesh.getShape().longName()
+        for attr in _DISPLAY_SHAPE_ATTRS:
+            cmds.setAttr("%s.%s" % (display_mesh_shape, attr), 0)
+
+        if light is None:
+            return
+
+        # Rotate
+        display_mesh.rotateX.set(90)
+        pm.makeIdentity(display_mesh, apply=True, t=1, r=1, s=1, n=0, pn=1)
+        display_mesh.rotateOrder.set(2)
+
+        # Align mesh to light
+        pm.matchTransform(display_mesh, light, position=True, rotation=True)
+
+    def _connectNegated(self, source, destination, name):
+        """ Drive attribute by the negated value of another one.
+
+            Args:
+                source (str): Attribute to negate.
+                destination (str): Attribute driven.
+                name (str): Name of negate node.
+
+            Returns:
+                (str): Negate node.
+        """
+        negate = cmds.createNode("multDoubleLinear", name=name, skipSelect=True)
+        cmds.setAttr("%s.input2" % negate, -1)
+        cmds.connectAttr(source, "%s.input1" % negate)
+        cmds.connectAttr("%s.output" % negate, destination, force=True)
+        return negate
+
+    def _lockAttributes(self, node, attributes):
+        """ Lock node attributes from their names.
+
+            Args:
+                node (str): Node to lock.
+                attributes (list): Attributes to lock.
+        """
+        node_name = str(node)
+        for attribute in attributes:
+            cmds.setAttr("%s.%s" % (node_name, attribute), lock=True)
+
+    def _assignShader(self, meshes, shader):
+        """ Assign shader to meshes through its shading group, without selecting them.
+
+            Args:
+                meshes (list): Meshes to assign.
+                shader (str): Shader to assign.
+
+            Returns:
+                (str): Shading group used.
+        """
+        meshes = [str(mesh) for mesh in meshes]
+        shading_groups = cmds.listConnections("%s.outColor" % shader, source=False, destination=True, type="shadingEngine")
+        if not shading_groups:
+            cmds.select(meshes)
+            cmds.hyperShade(assign=str(shader))
+            return None
+
+        cmds.sets(meshes, edit=True, forceElement=shading_groups[0])
+        return shading_groups[0]
+
+    def _deleteExistingNodes(self, nodes):
+        """ Delete nodes that exist in one command.
+
+            Args:
+                nodes (list): Node names to delete if they exist.
+
+            Returns:
+                (list): Nodes deleted.
+        """
+        existing = cmds.ls(nodes) if nodes else []
+        if existing:
+            cmds.delete(existing)
+
+        return existing
+
+    def _deleteDisplayDrivers(self, display_grp):
+        """ Delete expressions and negate nodes connected to the displays under a group.
+
+            Args:
+                display_grp (str): Display group to search.
+
+            Returns:
+                (list): Nodes deleted.
+        """
+        if not cmds.objExists(display_grp):
+            return []
+
+        displays = cmds.listRelatives(display_grp, allDescendents=True, type="transform", fullPath=True)
+        if not displays:
+            return []
+
+        connected = cmds.listConnections(displays)
+        drivers = list(set(cmds.ls(connected, type=["expression", "multDoubleLinear"]))) if connected else []
+        if drivers:
+            cmds.delete(drivers)
+
+        return drivers
+
 
 class JMLookThroughWindow(MayaQWidgetDockableMixin, QWidget):
     """ LookThrough window. """
@@ -2136,6 +2380,7 @@ class JMLookThroughWindow(MayaQWidgetDockableMixin, QWidget):
         self.preferredSize = self.starting_size
         self.resize(self.preferredSize)
         self.panel = None
+        self.lightname = None
 
         self.deleteThroughCam()
 
@@ -2153,27 +2398,35 @@ class JMLookThroughWindow(MayaQWidgetDockableMixin, QWidget):
 
         self.setLayout(layout)
 
-        # Get layout name
-        layout_name = omui.MQtUtil.fullName(long(getCppPointer(layout)[0]))
-        old_parent = pm.setParent(query=True)
-        pm.cmds.setParent(layout_name)
-
-        # Either create or get panel
+    def showEvent(self, event):
+        """ Build model panel on first show, unless a look through already built it. """
+        super(JMLookThroughWindow, self).showEvent(event)
+        if self.panel is None:
+            self._buildPanel()
+
+    def _buildPanel(self):
+        """ Create model panel under window layout. """
+        # Get layout name, shiboken2 is only needed by this window
+        from shiboken2 import getCppPointer
+        self._layout_name = omui.MQtUtil.fullName(int(getCppPointer(self.layout())[0]))
+        old_parent = cmds.setParent(query=True)
+        cmds.setParent(self._layout_name)
+
+        # Either create or get panel, created labeled under current parent layout
         panel_name = self.objectName() + "ModelPanelLabel"
-        previous_panel = pm.cmds.getPanel(withLabel=panel_name)
-        self.panel = pm.cmds.modelPanel()
-        pm.cmds.modelPanel(self.panel, edit=True, label=panel_name, parent=layout)
+        previous_panel = cmds.getPanel(withLabel=panel_name)
+        self.panel = cmds.modelPanel(label=panel_name)
 
         # Delete previous panel
         if previous_panel is not None:
             pm.deleteUI(previous_panel, panel=True)
 
         # Edit panel
-        editor = pm.cmds.modelPanel(self.panel, query=True, modelEditor=True)
-        pm.cmds.modelEditor(editor, edit=True, displayAppearance="smoothShaded", locators=True)
+        editor = cmds.modelPanel(self.panel, query=True, modelEditor=True)
+        cmds.modelEditor(editor, edit=True, displayAppearance="smoothShaded", locators=True)
 
         # Set Parent
-        pm.cmds.setParent(old_parent)
+        cmds.setParent(old_parent)
 
     def dockCloseEventTriggered(self):
         """ Close event. """
@@ -2183,29 +2436,42 @@ class JMLookThroughWindow(MayaQWidgetDockableMixin, QWidget):
 
     def deleteThroughCam(self):
         """ Delete Camera created by looktrough. """
-        looked_through = _lightToolkitWindow._isLookThrough()
+        looked_through = _lightToolkitWindow._getLookThrough()
         if looked_through is not None:
             pm.delete(looked_through)
+            _lightToolkitWindow._current_lookthrough = None
 
     def selectLight(self):
         """ Select light from look through window. """
         pm.select(self.lightname)
 
-    def lookThroughSelectedLight(self):
+    def lookThroughSelectedLight(self, selected=None):
+        """ Look through last light selected.
+
+            Args:
+                selected (list): Lights already queried from selection. Queried again if None.
+        """
         self.lightname = None
-        selected = _lightToolkitWindow._onlyLightsFromSelection()
+        if selected is None:
+            selected = _lightToolkitWindow._onlyLightsFromSelection()
         if selected:
             self.lightname = selected[-1].name()
 
+        # Show event may not have come yet, tabbed behind the toolkit for example
+        if self.lightname and self.panel is None:
+            self._buildPanel()
+
         if self.lightname and self.panel:
             self.setWindowTitle(self.lightname)
-            cmd = "lookThroughModelPanelClipped(\"" + self.lightname + "\", \"" + self.panel + "\", 0.001, 1000)"
-            pm.mel.eval(cmd)
+            pm.mel.lookThroughModelPanelClipped(self.lightname, self.panel, 0.001, 1000)
+            camera = (cmds.listRelatives(self.lightname, shapes=True, type="camera", fullPath=True) or [None])[0]
+            _lightToolkitWindow._current_lookthrough = camera
             _logger.info("Look through : %s" % self.lightname)
 
-            if pm.objExists("cameraShape1"):
-                pm.setAttr("cameraShape1.farClipPlane", 1000000)
-                pm.setAttr("cameraShape1.nearClipPlane", 0.001)
+            # Widen clip planes of the camera just created
+            if camera is not None:
+                cmds.setAttr("%s.farClipPlane" % camera, 1000000)
+                cmds.setAttr("%s.nearClipPlane" % camera, 0.001)
 
         else:
             self.setWindowTitle("NO LIGHT")
@@ -2233,6 +2499,15 @@ class JMUnusedLightFiltersWindow(MayaQWidgetDockableMixin, QWidget, Ui_widget_un
         self.label_nullFilters.setStyleSheet("QLabel{background:rgb(20,200,180); color:rgb(255,255,255)}")
 
         # Connect Methods to UI
+        self.listWidget_disconnectedFilters.itemDoubleClicked.connect(self.selectFilter)
+        self.listWidget_nullFilters.itemDoubleClicked.connect(self.selectFilter)
+        for list_widget in (self.listWidget_disconnectedFilters, self.listWidget_nullFilters):
+            # Right click menu replaces the former per-row select button
+            select_action = QtWidgets.QAction(getIcon("icon_select2.png"), "Select", list_widget)
+            select_action.triggered.connect(self.selectSelectedFilters)
+            list_widget.addAction(select_action)
+            list_widget.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+            list_widget.setToolTip("Double click or right click > Select to select filters in the scene.")
         self.pushButton_delete.clicked.connect(self.deleteSelectedFilters)
         self.pushButton_delete.clicked.connect(self.close)
         self.pushButton_cancel.clicked.connect(self.close)
@@ -2242,10 +2517,8 @@ class JMUnusedLightFiltersWindow(MayaQWidgetDockableMixin, QWidget, Ui_widget_un
 
     def dockCloseEventTriggered(self):
         """ Close event. """
-        control = FILTERS_NAME + "WorkspaceControl"
-        if pm.workspaceControl(control, q=True, exists=True) and _lightFiltersWindow is None:
-            pm.workspaceControl(control, e=True, close=True)
-            pm.deleteUI(control)
+        if _lightFiltersWindow is None:
+            deleteWorkspaceControl(FILTERS_NAME + "WorkspaceControl")
 
         unusedFiltersWindowClosed()
 
@@ -2262,35 +2535,42 @@ class JMUnusedLightFiltersWindow(MayaQWidgetDockableMixin, QWidget, Ui_widget_un
 
         return filters_to_delete
 
+    def selectFilter(self, item):
+        """ Select light filter from double clicked item. """
+        filter_name = item.data(CUSTOM_INDEX)
+        pm.select(filter_name)
+        _logger.info("select : %s" % filter_name)
+
+    def selectSelectedFilters(self):
+        """ Select light filters of selected items in both lists. """
+        filters = self.getSelectedFilters()
+        filter_names = [name for name in filters["disconnected"] + filters["null"] if cmds.objExists(name)]
+        if filter_names:
+            cmds.select(filter_names, replace=True)
+            _logger.info("select : %s", filter_names)
+
     def deleteSelectedFilters(self):
         filters = self.getSelectedFilters()
         self.deleteSafelyLightFilter(filters)
 
     def __populateList(self):
-        """ Populate 'Disconnected' and 'Null' list widget. """
-        if self.disconnected_filters:
-            for filter in self.disconnected_filters:
-                item_ui = JMUnusedLightFiltersItem(filter.name())
+        """ Populate 'Disconnected' and 'Null' list widget, rows are plain items drawn by the list delegate. """
+        lists = [
+            (self.listWidget_disconnectedFilters, self.disconnected_filters),
+            (self.listWidget_nullFilters, self.null_filters) ]
 
-                list_widget_item = QtWidgets.QListWidgetItem()
-                list_widget_item.setSizeHint(item_ui.sizeHint())
-                list_widget_item.setData(CUSTOM_INDEX, filter.name())
+        for list_widget, filters in lists:
+            # All rows look the same, lay them out once after all inserts
+            list_widget.setUniformItemSizes(True)
+            list_widget.setUpdatesEnabled(False)
+            list_widget.clear()
+            for lightfilter in filters:
+                filter_name = lightfilter.name()
+                list_widget_item = QtWidgets.QListWidgetItem(filter_name)
+                list_widget_item.setData(CUSTOM_INDEX, filter_name)
+                list_widget.addItem(list_widget_item)
 
-                self.listWidget_disconnectedFilters.addItem(list_widget_item)
-                self.listWidget_disconnectedFilters.setItemWidget(list_widget_item, item_ui)
-
-        if self.null_filters:
-            for filter in self.null_filters:
-                item_ui = JMUnusedLightFiltersItem(filter.name())
-
-                list_widget_item = QtWidgets.QListWidgetItem()
-                list_widget_item.setSizeHint(item_ui.sizeHint())
-                list_widget_item.setData(CUSTOM_INDEX, filter.name())
-
-                self.listWidget_nullFilters.addItem(list_widget_item)
-                self.listWidget_nullFilters.setItemWidget(list_widget_item, item_ui)
-
-        return self.disconnected_filters + self.null_filters
+            list_widget.setUpdatesEnabled(True)
 
 
 class JMLightOptimizerItem(QWidget, Ui_widget_lightOptimizerItem):
@@ -2309,16 +2589,10 @@ class JMLightOptimizerItem(QWidget, Ui_widget_lightOptimizerItem):
         self.attribute = datas["attribute"]
         self.light_type = datas["type"]
         self.current_value = datas["value"]
-        self.node = pm.PyNode(self.lightname)
-        self.transform_node = self.node.getParent()
-
-        # Stylize button
-        button_CSS = "QPushButton{border-radius:20px; background-color: #5d5d5d; border:5px #14E696;} "
-        button_hover_CSS = "QPushButton:hover{border-radius:20px; background-color: #949494; border:5px #14E696;} "
-        self.pushButton_Icon.setStyleSheet(button_CSS + button_hover_CSS)
+        self.transform_node = datas["transform"]
 
-        light_icon = QtGui.QIcon(os.path.join(PROJECT_DIR, "resources", "icons", "%s.svg" % self.light_type))
-        self.pushButton_Icon.setIcon(light_icon)
+        # Button stylized by the optimizer list stylesheet
+        self.pushButton_Icon.setIcon(getIcon("%s.svg" % self.light_type))
 
         # Connect Methods to UI
         self.pushButton_Icon.clicked.connect(self.selectLight)
@@ -2326,37 +2600,18 @@ class JMLightOptimizerItem(QWidget, Ui_widget_lightOptimizerItem):
 
     def selectLight(self):
         """ Select light. """
-        pm.select(self.transform_node)
+        cmds.select(self.transform_node, replace=True)
         _logger.info("select : %s" % self.transform_node)
 
     def setValue(self):
         """ Set new value attribute. """
         value = self.doubleSpinBox_attributeValue.value()
-        pm.setAttr("%s.%s" % (self.lightname, self.attribute), value)
+        cmds.setAttr("%s.%s" % (self.lightname, self.attribute), value)
 
         self.populate_parent()
         _logger.info("value : {0}, attribute : {1}, light : {2}".format(value, self.attribute, self.lightname))
 
 
-class JMUnusedLightFiltersItem(QWidget, Ui_widget_unusedFiltersItem):
-    """ List disconnected and null light filters in list. """
-    def __init__(self, filter_name):
-        """ Initialize JMUnusedLightFiltersItem. """
-        super(JMUnusedLightFiltersItem, self).__init__()
-        self.setupUi(self)
-        self.filter_name = filter_name
-
-        self.label_filterName.setText(self.filter_name)
-        select_icon = QtGui.QIcon(os.path.join(PROJECT_DIR, "resources", "icons", "icon_select2.png"))
-        self.pushButton_select.setIcon(select_icon)
-        self.pushButton_select.clicked.connect(self.selectFilter)
-
-    def selectFilter(self):
-        """ Select light filter from item. """
-        pm.select(self.filter_name )
-        _logger.info("select : %s" % self.filter_name )
-
-
 def loadMtoA():
     """ Prompt a dialog and ask if you want load MtoA. """
     if not pm.pluginInfo("mtoa", q=True, loaded=True):
@@ -2366,12 +2621,18 @@ def loadMtoA():
 
         if status == "Yes":
             try: pm.loadPlugin("mtoa")
-            except RuntimeError, e: _logger.warning(e)
+            except RuntimeError as e: _logger.warning(e)
 
 def saveWindowState(editor, optionVar):
     windowState = editor.showRepr()
     cmds.optionVar(sv=(optionVar, windowState))
 
+def deleteWorkspaceControl(control):
+    """ Close and delete a stale workspace control left by a previous window. """
+    if cmds.workspaceControl(control, query=True, exists=True):
+        cmds.workspaceControl(control, edit=True, close=True)
+        cmds.deleteUI(control)
+
 def mainWindowClosed():
     """ Hook up callback when the main window is closed. """
     global _lightToolkitWindow
@@ -2379,6 +2640,7 @@ def mainWindowClosed():
     global _lightFiltersWindow
 
     if _lightToolkitWindow:
+        _lightToolkitWindow.removeCallbacks()
         _lightToolkitWindow = None
         _lookThroughWindow = None
         _lightFiltersWindow = None
@@ -2393,11 +2655,9 @@ def main(restore=False):
     loadMtoA()
     global _lightToolkitWindow
 
-    if not restore:
-        control = TOOLKIT_NAME + "WorkspaceControl"
-        if pm.workspaceControl(control, q=True, exists=True) and _lightToolkitWindow is None:
-            pm.workspaceControl(control, e=True, close=True)
-            pm.deleteUI(control)
+    # Only look for a stale control when no window is alive
+    if not restore and _lightToolkitWindow is None:
+        deleteWorkspaceControl(TOOLKIT_NAME + "WorkspaceControl")
 
     if restore:
         parent = omui.MQtUtil.getCurrentParent()
@@ -2407,8 +2667,9 @@ def main(restore=False):
         _lightToolkitWindow.setObjectName(TOOLKIT_NAME)
 
     if restore:
-        mixinPtr = omui.MQtUtil.findControl(_lightToolkitWindow.objectName())
-        omui.MQtUtil.addWidgetToMayaLayout(long(mixinPtr), long(parent))
+        # int() promotes to long on Py2 when needed and works on Py3
+        mixin_ptr = int(omui.MQtUtil.findControl(_lightToolkitWindow.objectName()))
+        omui.MQtUtil.addWidgetToMayaLayout(mixin_ptr, int(parent))
 
     else:
         _lightToolkitWindow.show(dockable=True,
@@ -2431,19 +2692,20 @@ def lookThroughWindowChanged():
     global _lookThroughWindow
     saveWindowState(_lookThroughWindow, THROUGH_NAME + "State")
 
-def createLookThroughWindow():
-    """ Show through Window. """
+def createLookThroughWindow(lights=None):
+    """ Show through Window.
+
+        Args:
+            lights (list): Lights already queried from selection. Queried again if None.
+    """
     global _lookThroughWindow
 
-    if (_lightToolkitWindow is None) and not (_lightToolkitWindow._onlyLightsFromSelection()):
+    if _lightToolkitWindow is None:
         return None
 
-    control = THROUGH_NAME + "WorkspaceControl"
-    if pm.workspaceControl(control, q=True, exists=True) and _lookThroughWindow is None:
-        pm.workspaceControl(control, e=True, close=True)
-        pm.deleteUI(control)
-
+    # Only look for a stale control when no window is alive
     if _lookThroughWindow is None:
+        deleteWorkspaceControl(THROUGH_NAME + "WorkspaceControl")
         _lookThroughWindow = JMLookThroughWindow()
         _lookThroughWindow.windowStateChanged.connect(lookThroughWindowChanged)
 
@@ -2451,7 +2713,7 @@ def createLookThroughWindow():
     _lookThroughWindow.show(dockable=True, controls=required_control,
         closeCallback='import jmLightToolkit\njmLightToolkit.lookThroughWindowClosed()')
 
-    _lookThroughWindow.lookThroughSelectedLight()
+    _lookThroughWindow.lookThroughSelectedLight(lights)
     return _lookThroughWindow
 
 def unusedFiltersWindowClosed():
@@ -2472,12 +2734,9 @@ def createUnusedFiltersWindow(filters, deleteFiltersFunc):
     if _lightToolkitWindow is None:
         return None
 
-    control = FILTERS_NAME + "WorkspaceControl"
-    if pm.workspaceControl(control, q=True, exists=True) and _lightFiltersWindow is None:
-        pm.workspaceControl(control, e=True, close=True)
-        pm.deleteUI(control)
-
+    # Only look for a stale control when no window is alive
     if _lightFiltersWindow is None:
+        deleteWorkspaceControl(FILTERS_NAME + "WorkspaceControl")
         _lightFiltersWindow = JMUnusedLightFiltersWindow(filters, deleteFiltersFunc)
         _lightFiltersWindow.windowStateChanged.connect(unusedFiltersWindowChanged)
 
@@ -1464,34 +1464,3 @@ class Ui_widget_unusedFiltersList(object):
         self.label_nullFilters.setText(QtWidgets.QApplication.translate("widget_unusedFiltersList", "<html><head/><body><p><span style=\" color:#ffffff;\">Null filters</span></p></body></html>", None, -1))
         self.pushButton_delete.setText(QtWidgets.QApplication.translate("widget_unusedFiltersList", "Delete", None, -1))
         self.pushButton_cancel.setText(QtWidgets.QApplication.translate("widget_unusedFiltersList", "Cancel", None, -1))
-
-
-class Ui_widget_unusedFiltersItem(object):
-    def setupUi(self, widget_unusedFiltersItem):
-        widget_unusedFiltersItem.setObjectName("widget_unusedFiltersItem")
-        widget_unusedFiltersItem.resize(300, 50)
-        self.horizontalLayout = QtWidgets.QHBoxLayout(widget_unusedFiltersItem)
-        self.horizontalLayout.setObjectName("horizontalLayout")
-        self.label_filterName = QtWidgets.QLabel(widget_unusedFiltersItem)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.label_filterName.sizePolicy().hasHeightForWidth())
-        self.label_filterName.setSizePolicy(sizePolicy)
-        self.label_filterName.setMinimumSize(QtCore.QSize(50, 0))
-        self.label_filterName.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
-        self.label_filterName.setObjectName("label_filterName")
-        self.horizontalLayout.addWidget(self.label_filterName)
-        self.pushButton_select = QtWidgets.QPushButton(widget_unusedFiltersItem)
-        self.pushButton_select.setMinimumSize(QtCore.QSize(25, 25))
-        self.pushButton_select.setMaximumSize(QtCore.QSize(25, 25))
-        self.pushButton_select.setText("")
-        self.pushButton_select.setObjectName("pushButton_select")
-        self.horizontalLayout.addWidget(self.pushButton_select)
-
-        self.retranslateUi(widget_unusedFiltersItem)
-        QtCore.QMetaObject.connectSlotsByName(widget_unusedFiltersItem)
-
-    def retranslateUi(self, widget_unusedFiltersItem):
-        widget_unusedFiltersItem.setWindowTitle(QtWidgets.QApplication.translate("widget_unusedFiltersItem", "Form", None, -1))
-        self.label_filterName.setText(QtWidgets.QApplication.translate("widget_unusedFiltersItem", "filename", None, -1))